@@ -0,0 +1,103 @@
+"""
+OptimEngine — L1 solve cache
+In-process LRU for deterministic solver calls, keyed by a canonical hash of the request.
+
+Design:
+- AI agents retry and re-submit identical problems; OR-Tools solves dominate latency,
+  so an identical request is answered from memory instead of re-solving.
+- Inputs fully determine outputs, so entries are never invalidated — only evicted (LRU).
+- Error and timeout responses are not cached: a retry may legitimately succeed.
+- Keys are built from a canonical form: lookup tables (setup times, distance matrix) and
+  eligible machine sets are sorted, and fields left at their default are dropped, so the
+  same problem sent with explicit defaults or a reshuffled lookup table hits the same entry.
+  Lists whose order shows up in the response (jobs, machines, vehicles, locations, items,
+  bins) keep the caller's order: a cached response must be exactly what a fresh solve
+  of that request would return.
+- Cache size via SOLVE_CACHE_SIZE env var (0 disables the cache).
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from operator import itemgetter
+from threading import Lock
+from typing import Callable
+
+from api.metrics import SOLVE_CACHE_HITS_TOTAL
+
+SOLVE_CACHE_SIZE = int(os.environ.get("SOLVE_CACHE_SIZE", 512))
+
+# Statuses whose responses must be recomputed on every call.
+_UNCACHEABLE_STATUSES = frozenset({"error", "timeout"})
+
+_cache: OrderedDict = OrderedDict()
+_cache_lock = Lock()
+
+
+# Lists whose order never reaches the response, per solver: field -> key fields to sort by.
+# The engines read these into lookup dicts; the sort is stable, so a duplicated entry still
+# overrides the earlier one. Entity lists are not here: the response lists schedules,
+# routes, assignments and bin summaries in request order.
+_UNORDERED_FIELDS = {
+    "solve_schedule": {
+        "setup_times": ("machine_id", "from_job_id", "to_job_id"),
+    },
+    "solve_routing": {
+        "distance_matrix": ("from_id", "to_id"),
+    },
+}
+
+
+def _canonical(solver: str, request) -> dict:
+    """Request as a dict in canonical form (see module docstring)."""
+    data = request.model_dump(mode="json", exclude_defaults=True)
+    for field, keys in _UNORDERED_FIELDS.get(solver, {}).items():
+        if data.get(field):
+            data[field] = sorted(data[field], key=itemgetter(*keys))
+    if solver == "solve_schedule":
+        for job in data["jobs"]:
+            for task in job["tasks"]:
+                task["eligible_machines"] = sorted(task["eligible_machines"])
+    return data
+
+
+def request_key(fn: Callable, request) -> bytes:
+    """Canonical hash of (solver, request). Dict keys are sorted so field order never matters."""
+    payload = json.dumps(
+        _canonical(fn.__name__, request), sort_keys=True, separators=(",", ":")
+    )
+    h = hashlib.blake2b(digest_size=16)
+    h.update(fn.__name__.encode())
+    h.update(payload.encode())
+    return h.digest()
+
+
+def lookup(fn: Callable, request) -> tuple[bytes, object]:
+    """Return (key, cached response or None). The key is passed back to store()."""
+    key = request_key(fn, request)
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None:
+            _cache.move_to_end(key)
+    if hit is not None:
+        SOLVE_CACHE_HITS_TOTAL.labels(solver=fn.__name__).inc()
+    return key, hit
+
+
+def store(key: bytes, response) -> None:
+    """Remember a response, evicting the least recently used entries beyond SOLVE_CACHE_SIZE."""
+    status = getattr(response.status, "value", response.status)
+    if SOLVE_CACHE_SIZE <= 0 or status in _UNCACHEABLE_STATUSES:
+        return
+    with _cache_lock:
+        _cache[key] = response
+        _cache.move_to_end(key)
+        while len(_cache) > SOLVE_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def clear() -> None:
+    """Drop every cached response."""
+    with _cache_lock:
+        _cache.clear()
@@ -94,6 +94,13 @@ SOLVER_TIMEOUT_TOTAL = Counter(
     registry=REGISTRY,
 )
 
+SOLVE_CACHE_HITS_TOTAL = Counter(
+    "optimengine_solve_cache_hits_total",
+    "L1 solver calls answered from the in-process solve cache",
+    ["solver"],
+    registry=REGISTRY,
+)
+
 
 # ─── HTTP Middleware ────────────────────────────────────────────────────
 class PrometheusMiddleware(BaseHTTPMiddleware):
@@ -132,6 +139,20 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
         return response
 
 
+def endpoint_totals(endpoints: frozenset[str]) -> tuple[int, float]:
+    """(requests, total seconds) served by the given endpoints, read back from HTTP_REQUEST_DURATION."""
+    count, total = 0, 0.0
+    for metric in HTTP_REQUEST_DURATION.collect():
+        for sample in metric.samples:
+            if sample.labels.get("endpoint") not in endpoints:
+                continue
+            if sample.name.endswith("_count"):
+                count += int(sample.value)
+            elif sample.name.endswith("_sum"):
+                total += sample.value
+    return count, total
+
+
 # ─── Solver Decorator ───────────────────────────────────────────────────
 # Maps OR-Tools status integer codes to readable labels.
 # 0=UNKNOWN, 1=MODEL_INVALID, 2=FEASIBLE, 3=INFEASIBLE, 4=OPTIMAL
@@ -172,9 +193,9 @@ def instrument_solver(endpoint: str, objective_path: str | None = None):
                 result = await func(*args, **kwargs)
                 _record(endpoint, result, time.perf_counter() - start, objective_path)
                 return result
-            except Exception:
+            except Exception as e:
                 SOLVER_REQUESTS_TOTAL.labels(
-                    endpoint=endpoint, solver_status="ERROR"
+                    endpoint=endpoint, solver_status=_error_status(e)
                 ).inc()
                 raise
             finally:
@@ -188,9 +209,9 @@ def instrument_solver(endpoint: str, objective_path: str | None = None):
                 result = func(*args, **kwargs)
                 _record(endpoint, result, time.perf_counter() - start, objective_path)
                 return result
-            except Exception:
+            except Exception as e:
                 SOLVER_REQUESTS_TOTAL.labels(
-                    endpoint=endpoint, solver_status="ERROR"
+                    endpoint=endpoint, solver_status=_error_status(e)
                 ).inc()
                 raise
             finally:
@@ -204,6 +225,11 @@ def instrument_solver(endpoint: str, objective_path: str | None = None):
     return decorator
 
 
+def _error_status(exc: Exception) -> str:
+    """solver_status label for a failed call: load-shed (429) requests are not solver errors."""
+    return "REJECTED" if getattr(exc, "status_code", None) == 429 else "ERROR"
+
+
 def _resolve_path(obj, path: str):
     """Walk dotted attribute path safely. Returns None on any miss."""
     current = obj
@@ -216,6 +242,8 @@ def _resolve_path(obj, path: str):
 
 def _record(endpoint: str, result, duration: float, objective_path: str | None) -> None:
     """Extract status + objective from result and update metrics."""
+    # Streaming responses wrap the solver result instead of being it.
+    result = getattr(result, "solver_result", result)
     SOLVER_DURATION.labels(endpoint=endpoint).observe(duration)
 
     status = getattr(result, "status", None)
@@ -0,0 +1,60 @@
+"""
+OptimEngine — JSON response classes
+
+Design:
+- Solver endpoints declare a response_model, so FastAPI already serializes them
+  straight to bytes through pydantic-core. They keep the default response class:
+  a custom class would disable that fast path.
+- Plain-dict routes (info, discovery, error handlers, middleware rejections)
+  go through orjson instead of the stdlib json encoder.
+- Large solver results can be streamed (?stream=1): list fields are encoded element
+  by element and flushed in ~64 KB chunks, so the full JSON body is never held in
+  memory and clients start parsing before encoding finishes.
+"""
+
+from typing import Any, Iterator
+
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (drop-in for the deprecated fastapi ORJSONResponse)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+class ModelStreamingResponse(StreamingResponse):
+    """Streams a pydantic model as JSON. The model stays available as .solver_result (for metrics)."""
+
+    def __init__(self, model: BaseModel, **kwargs):
+        self.solver_result = model
+        super().__init__(_iter_model_json(model), media_type="application/json", **kwargs)
+
+
+def _iter_model_json(model: BaseModel) -> Iterator[bytes]:
+    buf = bytearray(b"{")
+    for i, name in enumerate(type(model).model_fields):
+        if i:
+            buf += b","
+        buf += orjson.dumps(name) + b":"
+        value = getattr(model, name)
+        if not (isinstance(value, list) and value and isinstance(value[0], BaseModel)):
+            buf += to_json(value)
+            continue
+        buf += b"["
+        for j, item in enumerate(value):
+            if j:
+                buf += b","
+            buf += to_json(item)
+            if len(buf) >= STREAM_CHUNK_BYTES:
+                yield bytes(buf)
+                buf.clear()
+        buf += b"]"
+    buf += b"}"
+    yield bytes(buf)
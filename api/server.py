@@ -5,50 +5,47 @@ Operations Intelligence Solver: L1 + L2 + L2.5 + L3
 from api.observability import init_telemetry, get_tracer
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
+import asyncio
+import importlib
+import logging
+import multiprocessing
 import os
 import time
 from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from threading import Lock
 from contextlib import asynccontextmanager
-
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
-
-from solver.models import ScheduleRequest, ScheduleResponse
-from solver.engine import solve_schedule
-from solver.models import ValidateRequest, ValidateResponse
-from solver.validator import validate_schedule
-
-from routing.models import RoutingRequest, RoutingResponse
-from routing.engine import solve_routing
-
-from packing.models import PackingRequest, PackingResponse
-from packing.engine import solve_packing
-
-from sensitivity.models import SensitivityRequest, SensitivityResponse
-from sensitivity.engine import analyze_sensitivity as run_sensitivity
-
-from robust.models import RobustRequest, RobustResponse
-from robust.engine import optimize_robust as run_robust
-
-from stochastic.models import StochasticRequest, StochasticResponse
-from stochastic.engine import optimize_stochastic as run_stochastic
-
-from pareto.models import ParetoRequest, ParetoResponse
-from pareto.engine import optimize_pareto as run_pareto
-
-from prescriptive.models import PrescriptiveRequest, PrescriptiveResponse
-from prescriptive.engine import prescriptive_advise as run_prescriptive
+from functools import partial
+
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from starlette.concurrency import run_in_threadpool
+from api.responses import FastJSONResponse, ModelStreamingResponse
+from api.jsonroute import OrjsonRoute
+
+# ─── Logging ───
+# One root handler for the app, OTel setup and (via log_config=None below) uvicorn itself.
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+logger = logging.getLogger("optimengine")
 
 # ─── Prometheus metrics ───
 from api.metrics import (
     PrometheusMiddleware,
+    endpoint_totals,
     instrument_solver,
     verify_metrics_token,
     metrics_response,
 )
 from fastapi import Depends
 
+# ─── L1 solve cache ───
+from api import cache as solve_cache
+from solver import parallel as subsolve_pool
+
 # ─── ScaleKit OAuth via PyJWT (MCP v2 auth) ───
 # Uses PyJWT + cryptography to validate ScaleKit-issued JWTs directly,
 # avoiding the scalekit-sdk-python package which conflicts with OR-Tools protobuf.
@@ -68,9 +65,9 @@ if _SCALEKIT_READY:
             cache_keys=True,
             lifespan=3600,
         )
-        print(f"\u2705 ScaleKit JWKS client initialized for {_SCALEKIT_ENV_URL}")
+        logger.info("ScaleKit JWKS client initialized for %s", _SCALEKIT_ENV_URL)
     except Exception as e:
-        print(f"\u26a0\ufe0f  ScaleKit JWKS init failed: {e}")
+        logger.warning("ScaleKit JWKS init failed: %s", e)
         _SCALEKIT_READY = False
         _jwks_client = None
 
@@ -100,16 +97,168 @@ All solvers use Google OR-Tools. Exposed as MCP tools for AI agent discovery.
 """
 
 
+# ─── Enabled solver modules ───
+# One server, any subset of solver families: ENABLED_MODULES (comma-separated, default all)
+# decides which endpoints are registered. Engines are imported lazily by the endpoints.
+ALL_MODULES = ("scheduling", "routing", "packing", "sensitivity", "robust", "stochastic", "pareto", "prescriptive")
+ENABLED_MODULES = frozenset(
+    m.strip() for m in os.environ.get("ENABLED_MODULES", ",".join(ALL_MODULES)).split(",") if m.strip()
+)
+if ENABLED_MODULES - set(ALL_MODULES):
+    raise RuntimeError(f"Unknown ENABLED_MODULES: {sorted(ENABLED_MODULES - set(ALL_MODULES))}")
+
+# Tool name (= endpoint path and operation_id) -> module that provides it.
+TOOL_MODULES = {
+    "optimize_schedule": "scheduling",
+    "validate_schedule": "scheduling",
+    "optimize_routing": "routing",
+    "optimize_packing": "packing",
+    "analyze_sensitivity": "sensitivity",
+    "optimize_robust": "robust",
+    "optimize_stochastic": "stochastic",
+    "optimize_pareto": "pareto",
+    "prescriptive_advise": "prescriptive",
+}
+ENABLED_TOOLS = frozenset(t for t, m in TOOL_MODULES.items() if m in ENABLED_MODULES)
+
+
+def _engine(module: str, name: str):
+    """Solver entrypoint, imported on first call: OR-Tools loads with the first request, not at boot."""
+    return getattr(importlib.import_module(module), name)
+
+
+# ─── Solver process pool ───
+# OR-Tools solves are CPU-bound and hold the GIL for seconds. Running them in a
+# process pool keeps the event loop free (health checks, MCP handshakes) and lets
+# N cores solve N requests in parallel. A C++ crash in a solver kills a worker,
+# not the server. forkserver avoids forking the multithreaded server process.
+# The pool lives in app.state for the app's lifetime; its workers start in lifespan and
+# import OR-Tools and the enabled engines once, so requests never pay a cold start.
+
+# Each CP-SAT solve runs CPSAT_WORKERS search threads, so more than cpu_count // CPSAT_WORKERS
+# concurrent solves only thrash. Excess requests wait here (on the event loop, costing nothing)
+# and the in-flight/waiting counts are reported on /health for tuning.
+SOLVE_CONCURRENCY = int(os.environ.get(
+    "SOLVE_CONCURRENCY", max(1, (os.cpu_count() or 1) // subsolve_pool.CPSAT_WORKERS)
+))
+# At most SOLVE_CONCURRENCY solves are ever in the pool, and each warm worker holds OR-Tools
+# (~100 MB), so the pool is sized to match rather than to the CPU count.
+SOLVER_POOL_WORKERS = int(os.environ.get("SOLVER_POOL_WORKERS", SOLVE_CONCURRENCY))
+
+# Module that each pooled endpoint family runs in the worker.
+_POOLED_ENGINES = {
+    "scheduling": "solver.engine",
+    "routing": "routing.engine",
+    "packing": "packing.engine",
+}
+
+
+def _new_solver_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=SOLVER_POOL_WORKERS,
+        mp_context=multiprocessing.get_context("forkserver"),
+        initializer=subsolve_pool.preload,
+        initargs=(tuple(e for m, e in _POOLED_ENGINES.items() if m in ENABLED_MODULES),),
+    )
+
+
+_solve_slots = asyncio.Semaphore(SOLVE_CONCURRENCY)
+_solves_in_flight = 0
+_solves_waiting = 0
+# Past SOLVE_QUEUE_LIMIT waiting requests, new ones fail fast with 429 instead of queueing
+# behind minutes of solves (0 = never reject).
+SOLVE_QUEUE_LIMIT = int(os.environ.get("SOLVE_QUEUE_LIMIT", 4 * SOLVE_CONCURRENCY))
+
+
+@asynccontextmanager
+async def _solve_slot():
+    """Hold one of the SOLVE_CONCURRENCY solve slots; 429 if too many requests already wait."""
+    global _solves_in_flight, _solves_waiting
+    if SOLVE_QUEUE_LIMIT and _solve_slots.locked() and _solves_waiting >= SOLVE_QUEUE_LIMIT:
+        raise HTTPException(429, "Solver queue is full, retry shortly.", headers={"Retry-After": "5"})
+    _solves_waiting += 1
+    try:
+        await _solve_slots.acquire()
+    finally:
+        _solves_waiting -= 1
+    _solves_in_flight += 1
+    try:
+        yield
+    finally:
+        _solves_in_flight -= 1
+        _solve_slots.release()
+
+
+async def _solve_in_pool(fn, request):
+    """Run fn(request) in the solver pool, at most SOLVE_CONCURRENCY at a time."""
+    async with _solve_slot():
+        pool = app.state.solver_pool
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, fn, request)
+        except BrokenProcessPool:
+            # A worker died mid-solve; replace the pool so later requests still succeed.
+            # Every solve in flight on it fails together: only the first one swaps it out.
+            if app.state.solver_pool is pool:
+                app.state.solver_pool = _new_solver_pool()
+                pool.shutdown(wait=False)
+            raise
+
+
+async def _orchestrate_in_slot(fn, request):
+    """
+    Run fn(request) in the threadpool under a solve slot. For orchestrating endpoints
+    whose lead CP-SAT solve runs in this process (CPSAT_WORKERS threads) before the rest
+    fan out to the sub-solve pool: they count against SOLVE_CONCURRENCY and shed load
+    with 429 like the pooled L1 solves.
+    """
+    async with _solve_slot():
+        return await run_in_threadpool(fn, request)
+
+
+# Solves in progress by cache key: an identical request that arrives while one is being
+# solved waits for that result instead of queueing a second solve of the same problem.
+# The solve runs as its own task, so a client that disconnects doesn't cancel it for the others.
+_pending_solves: dict[bytes, asyncio.Task] = {}
+
+
+def _finish_pending(key: bytes, task: asyncio.Task) -> None:
+    del _pending_solves[key]
+    if not task.cancelled() and task.exception() is None:
+        solve_cache.store(key, task.result())
+
+
+async def _run_solver(fn, request):
+    """_solve_in_pool, reusing cached responses and in-progress solves for identical requests."""
+    key, hit = solve_cache.lookup(fn, request)
+    if hit is not None:
+        return hit
+    task = _pending_solves.get(key)
+    if task is None:
+        task = _pending_solves[key] = asyncio.ensure_future(_solve_in_pool(fn, request))
+        task.add_done_callback(partial(_finish_pending, key))
+    return await asyncio.shield(task)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print(f"🚀 {APP_NAME} v{APP_VERSION} starting...")
+    logger.info("%s v%s starting...", APP_NAME, APP_VERSION)
+    # Build the OpenAPI schema now: FastAPI caches it in app.openapi_schema, so /openapi.json,
+    # /docs and MCP tool discovery never pay for schema generation on a request.
+    app.openapi()
+    # Start every pool worker now (a no-op task each) so they import the engines before traffic.
+    app.state.solver_pool = pool = _new_solver_pool()
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(loop.run_in_executor(pool, int) for _ in range(SOLVER_POOL_WORKERS)))
     yield
-    print(f"👋 {APP_NAME} shutting down.")
+    app.state.solver_pool.shutdown(wait=False, cancel_futures=True)
+    subsolve_pool.shutdown()
+    logger.info("%s shutting down.", APP_NAME)
 
 init_telemetry()
 
 
 app = FastAPI(title=APP_NAME, version=APP_VERSION, description=APP_DESCRIPTION, lifespan=lifespan)
+app.router.route_class = OrjsonRoute
 FastAPIInstrumentor.instrument_app(app)
 # CORS middleware intenzionalmente rimosso (19 apr 2026). Per browser access, vedi optim-engine-proxy.
 
@@ -130,6 +279,7 @@ async def metrics(request: Request, _: None = Depends(verify_metrics_token)):
 
 # ── API Key Protection ──
 ENGINE_API_KEY = os.environ.get("ENGINE_API_KEY", "")
+_403_BODY = orjson.dumps({"error": "Forbidden", "message": "Invalid or missing X-Engine-Key"})
 
 @app.middleware("http")
 async def check_engine_key(request: Request, call_next):
@@ -141,7 +291,7 @@ async def check_engine_key(request: Request, call_next):
     if ENGINE_API_KEY:
         provided_key = request.headers.get("X-Engine-Key", "")
         if provided_key != ENGINE_API_KEY:
-            return JSONResponse(status_code=403, content={"error": "Forbidden", "message": "Invalid or missing X-Engine-Key"})
+            return Response(_403_BODY, status_code=403, media_type="application/json")
     return await call_next(request)
 
 # ─── Rate Limiting MCP (Free Tier) ───
@@ -167,7 +317,7 @@ async def mcp_rate_limit(request: Request, call_next):
     else:
         client_ip = request.client.host if request.client else "unknown"
 
-    now = time.time()
+    now = time.monotonic()  # window arithmetic only; immune to wall-clock jumps
     with _mcp_hits_lock:
         hits = _mcp_hits[client_ip]
         # Clean old hits outside the rolling window
@@ -175,7 +325,7 @@ async def mcp_rate_limit(request: Request, call_next):
             hits.popleft()
         if len(hits) >= MCP_RATE_LIMIT:
             retry_after = int(hits[0] + MCP_WINDOW_SECONDS - now)
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=429,
                 content={
                     "error": "Rate limit exceeded",
@@ -195,58 +345,46 @@ async def mcp_rate_limit(request: Request, call_next):
 
     return await call_next(request)
 
-_request_count = 0
-_total_solve_time = 0.0
-TRACKED_PATHS = ("/optimize_schedule", "/validate_schedule", "/optimize_routing", "/optimize_packing",
-    "/analyze_sensitivity", "/optimize_robust", "/optimize_stochastic", "/optimize_pareto", "/prescriptive_advise")
-
-@app.middleware("http")
-async def track_requests(request: Request, call_next):
-    global _request_count, _total_solve_time
-    start = time.time()
-    response = await call_next(request)
-    elapsed = time.time() - start
-    if request.url.path in TRACKED_PATHS:
-        _request_count += 1
-        _total_solve_time += elapsed
-    return response
-
-@app.get("/", operation_id="root", summary="Server info and status")
+# Request count and time for / are read back from the Prometheus HTTP histogram
+# (PrometheusMiddleware already times every request), so no extra per-request work.
+TRACKED_PATHS = frozenset({"/optimize_schedule", "/validate_schedule", "/optimize_routing", "/optimize_packing",
+    "/analyze_sensitivity", "/optimize_robust", "/optimize_stochastic", "/optimize_pareto", "/prescriptive_advise"})
+
+# Static parts of / and /health are serialized once; only the counters change per call.
+# Both stay out of the OpenAPI schema (and so out of the MCP tool list): agents only need the solvers.
+_ROOT_INFO = {
+    "name": APP_NAME, "version": APP_VERSION, "status": "operational",
+    "capabilities": {
+        "level_1": "Deterministic Optimization (scheduling, routing, packing)",
+        "level_2": "Optimization under Uncertainty (sensitivity, robust, stochastic)",
+        "level_2_5": "Multi-objective Optimization (pareto frontier)",
+        "level_3": "Prescriptive Intelligence (forecast + optimize + advise)",
+    },
+    "tools": [{"name": t, "endpoint": f"/{t}"} for t in TOOL_MODULES if t in ENABLED_TOOLS],
+    "mcp_endpoint": "/mcp",
+}
+_ROOT_HEAD = orjson.dumps(_ROOT_INFO)[:-1] + b',"stats":'
+_HEALTH_HEAD = orjson.dumps({"status": "healthy", "version": APP_VERSION})[:-1] + b',"solver_slots":'
+
+@app.get("/", operation_id="root", summary="Server info and status", response_class=FastJSONResponse, include_in_schema=False)
 async def root():
-    return {
-        "name": APP_NAME, "version": APP_VERSION, "status": "operational",
-        "capabilities": {
-            "level_1": "Deterministic Optimization (scheduling, routing, packing)",
-            "level_2": "Optimization under Uncertainty (sensitivity, robust, stochastic)",
-            "level_2_5": "Multi-objective Optimization (pareto frontier)",
-            "level_3": "Prescriptive Intelligence (forecast + optimize + advise)",
-        },
-        "tools": [
-            {"name": "optimize_schedule", "endpoint": "/optimize_schedule"},
-            {"name": "validate_schedule", "endpoint": "/validate_schedule"},
-            {"name": "optimize_routing", "endpoint": "/optimize_routing"},
-            {"name": "optimize_packing", "endpoint": "/optimize_packing"},
-            {"name": "analyze_sensitivity", "endpoint": "/analyze_sensitivity"},
-            {"name": "optimize_robust", "endpoint": "/optimize_robust"},
-            {"name": "optimize_stochastic", "endpoint": "/optimize_stochastic"},
-            {"name": "optimize_pareto", "endpoint": "/optimize_pareto"},
-            {"name": "prescriptive_advise", "endpoint": "/prescriptive_advise"},
-        ],
-        "stats": {"requests_served": _request_count, "total_solve_time_seconds": round(_total_solve_time, 2)},
-        "mcp_endpoint": "/mcp",
-    }
+    served, seconds = endpoint_totals(TRACKED_PATHS)
+    stats = {"requests_served": served, "total_solve_time_seconds": round(seconds, 2)}
+    return Response(_ROOT_HEAD + orjson.dumps(stats) + b"}", media_type="application/json")
 
-@app.get("/health", operation_id="health_check", summary="Health check")
+@app.get("/health", operation_id="health_check", summary="Health check", response_class=FastJSONResponse, include_in_schema=False)
 async def health():
-    return {"status": "healthy", "version": APP_VERSION}
+    slots = {"limit": SOLVE_CONCURRENCY, "in_flight": _solves_in_flight, "waiting": _solves_waiting,
+             "queue_limit": SOLVE_QUEUE_LIMIT}
+    return Response(_HEALTH_HEAD + orjson.dumps(slots) + b"}", media_type="application/json")
 
 # ─── OAuth Protected Resource Discovery (MCP v2) ───
-@app.get("/.well-known/oauth-protected-resource")
+@app.get("/.well-known/oauth-protected-resource", response_class=FastJSONResponse, include_in_schema=False)
 async def oauth_protected_resource():
     """MCP clients call this to discover the OAuth 2.1 authorization server."""
     base_url = os.environ.get("BASE_URL", "https://optim-engine-production.up.railway.app")
     if not _SCALEKIT_ENV_URL or not _SCALEKIT_RESOURCE_ID:
-        return JSONResponse(status_code=503, content={"error": "OAuth not configured"})
+        return FastJSONResponse(status_code=503, content={"error": "OAuth not configured"})
     return {
         "authorization_servers": [
             os.environ.get("BASE_URL", "https://optim-engine-production.up.railway.app")
@@ -257,7 +395,7 @@ async def oauth_protected_resource():
         "scopes_supported": [],
     }
 
-@app.get("/.well-known/oauth-authorization-server")
+@app.get("/.well-known/oauth-authorization-server", response_class=FastJSONResponse, include_in_schema=False)
 async def oauth_authorization_server():
     """Proxy ScaleKit's OAuth AS metadata with corrected issuer for RFC 8414 compliance.
     Smithery requires issuer == authorization_servers URL. ScaleKit sets issuer to the
@@ -265,7 +403,7 @@ async def oauth_authorization_server():
     the issuer set to our own BASE_URL so the match succeeds."""
     base_url = os.environ.get("BASE_URL", "https://optim-engine-production.up.railway.app")
     if not _SCALEKIT_ENV_URL or not _SCALEKIT_RESOURCE_ID:
-        return JSONResponse(status_code=503, content={"error": "OAuth not configured"})
+        return FastJSONResponse(status_code=503, content={"error": "OAuth not configured"})
     # Fetch the real metadata from ScaleKit (resource-scoped)
     try:
         sk_url = f"{_SCALEKIT_ENV_URL}/resources/{_SCALEKIT_RESOURCE_ID}/.well-known/oauth-authorization-server"
@@ -273,12 +411,12 @@ async def oauth_authorization_server():
         with urllib.request.urlopen(req, timeout=5) as resp:
             metadata = _json.loads(resp.read())
     except Exception as e:
-        return JSONResponse(status_code=502, content={"error": f"Failed to fetch ScaleKit metadata: {str(e)}"})
+        return FastJSONResponse(status_code=502, content={"error": f"Failed to fetch ScaleKit metadata: {str(e)}"})
     # Override issuer to match our authorization_servers URL (RFC 8414 compliance)
     metadata["issuer"] = base_url
     return metadata
 
-@app.get("/.well-known/mcp/server-card.json")
+@app.get("/.well-known/mcp/server-card.json", response_class=FastJSONResponse, include_in_schema=False)
 async def mcp_server_card():
     """Static server card for Smithery discovery — bypasses MCP scanning."""
     return {
@@ -290,7 +428,7 @@ async def mcp_server_card():
             "required": True,
             "schemes": ["oauth2"]
         },
-        "tools": [
+        "tools": [t for t in [
             {"name": "optimize_schedule", "description": "Solve a Flexible Job Shop Scheduling Problem — OR-Tools CP-SAT with precedence, time windows, setup times, priorities, 4 objectives", "inputSchema": {"type": "object", "properties": {"jobs": {"type": "array"}, "machines": {"type": "array"}, "objective": {"type": "string"}}, "required": ["jobs", "machines"]}},
             {"name": "validate_schedule", "description": "Validate an existing schedule against constraints", "inputSchema": {"type": "object", "properties": {"jobs": {"type": "array"}, "machines": {"type": "array"}, "schedule": {"type": "array"}}, "required": ["jobs", "machines", "schedule"]}},
             {"name": "optimize_routing", "description": "Solve a CVRPTW — OR-Tools Routing with capacity, time windows, GPS, drop visits", "inputSchema": {"type": "object", "properties": {"depot_id": {"type": "string"}, "locations": {"type": "array"}, "vehicles": {"type": "array"}, "distance_matrix": {"type": "array"}}, "required": ["depot_id", "locations", "vehicles", "distance_matrix"]}},
@@ -300,92 +438,133 @@ async def mcp_server_card():
             {"name": "optimize_stochastic", "description": "Stochastic Optimization — Monte Carlo simulation with CVaR risk metrics, normal/uniform/triangular/log-normal distributions", "inputSchema": {"type": "object", "properties": {"solver_type": {"type": "string"}, "solver_request": {"type": "object"}, "stochastic_parameters": {"type": "array"}}, "required": ["solver_type", "solver_request", "stochastic_parameters"]}},
             {"name": "optimize_pareto", "description": "Multi-objective Pareto Frontier — generate trade-off analysis for 2-4 competing objectives", "inputSchema": {"type": "object", "properties": {"solver_type": {"type": "string"}, "objectives": {"type": "array"}, "solver_request": {"type": "object"}}, "required": ["solver_type", "objectives", "solver_request"]}},
             {"name": "prescriptive_advise", "description": "Prescriptive Intelligence — forecast + optimize + risk assess + actionable recommendations with 3 risk appetites", "inputSchema": {"type": "object", "properties": {"solver_type": {"type": "string"}, "solver_request": {"type": "object"}, "forecast_parameters": {"type": "array"}}, "required": ["solver_type", "solver_request", "forecast_parameters"]}}
-        ],
+        ] if t["name"] in ENABLED_TOOLS],
         "resources": [],
         "prompts": []
     }
 
 # ─── L1 ───
 
-@app.post("/optimize_schedule", response_model=ScheduleResponse, operation_id="optimize_schedule",
-    summary="Solve a Flexible Job Shop Scheduling Problem",
-    description="OR-Tools CP-SAT. Precedence, time windows, setup times, priorities, 4 objectives.", tags=["L1 - Scheduling"])
-@instrument_solver("/optimize_schedule", objective_path="metrics.makespan")
-async def ep_schedule(request: ScheduleRequest) -> ScheduleResponse:
-    return solve_schedule(request)
-
-@app.post("/validate_schedule", response_model=ValidateResponse, operation_id="validate_schedule",
-    summary="Validate an existing schedule", description="Validates against constraints.", tags=["L1 - Scheduling"])
-async def ep_validate(request: ValidateRequest) -> ValidateResponse:
-    return validate_schedule(request)
-
-@app.post("/optimize_routing", response_model=RoutingResponse, operation_id="optimize_routing",
-    summary="Solve a CVRPTW", description="OR-Tools Routing. Capacity, time windows, GPS, drop visits.", tags=["L1 - Routing"])
-@instrument_solver("/optimize_routing", objective_path="metrics.total_distance")
-async def ep_routing(request: RoutingRequest) -> RoutingResponse:
-    return solve_routing(request)
-
-@app.post("/optimize_packing", response_model=PackingResponse, operation_id="optimize_packing",
-    summary="Solve a Bin Packing Problem", description="OR-Tools CP-SAT. Weight/volume, groups, partial packing.", tags=["L1 - Packing"])
-@instrument_solver("/optimize_packing", objective_path="metrics.bins_used")
-async def ep_packing(request: PackingRequest) -> PackingResponse:
-    return solve_packing(request)
+# ?stream=1 sends large schedules/routes/assignments as chunked JSON instead of one body.
+STREAM_QUERY = Query(False, description="Stream the JSON response in chunks (for very large results).")
+
+if "scheduling" in ENABLED_MODULES:
+    from solver.models import ScheduleRequest, ScheduleResponse, ValidateRequest, ValidateResponse
+
+    @app.post("/optimize_schedule", response_model=ScheduleResponse, operation_id="optimize_schedule",
+        summary="Solve a Flexible Job Shop Scheduling Problem",
+        description="OR-Tools CP-SAT. Precedence, time windows, setup times, priorities, 4 objectives.", tags=["L1 - Scheduling"])
+    @instrument_solver("/optimize_schedule", objective_path="metrics.makespan")
+    async def ep_schedule(request: ScheduleRequest, stream: bool = STREAM_QUERY) -> ScheduleResponse:
+        response = await _run_solver(_engine("solver.engine", "solve_schedule"), request)
+        return ModelStreamingResponse(response) if stream else response
+
+    @app.post("/validate_schedule", response_model=ValidateResponse, operation_id="validate_schedule",
+        summary="Validate an existing schedule", description="Validates against constraints.", tags=["L1 - Scheduling"])
+    def ep_validate(request: ValidateRequest) -> ValidateResponse:
+        # Pure-Python checks, no OR-Tools: a plain def runs in FastAPI's threadpool, off the loop.
+        return _engine("solver.validator", "validate_schedule")(request)
+
+if "routing" in ENABLED_MODULES:
+    from routing.models import RoutingRequest, RoutingResponse
+
+    @app.post("/optimize_routing", response_model=RoutingResponse, operation_id="optimize_routing",
+        summary="Solve a CVRPTW", description="OR-Tools Routing. Capacity, time windows, GPS, drop visits.", tags=["L1 - Routing"])
+    @instrument_solver("/optimize_routing", objective_path="metrics.total_distance")
+    async def ep_routing(request: RoutingRequest, stream: bool = STREAM_QUERY) -> RoutingResponse:
+        response = await _run_solver(_engine("routing.engine", "solve_routing"), request)
+        return ModelStreamingResponse(response) if stream else response
+
+if "packing" in ENABLED_MODULES:
+    from packing.models import PackingRequest, PackingResponse
+
+    @app.post("/optimize_packing", response_model=PackingResponse, operation_id="optimize_packing",
+        summary="Solve a Bin Packing Problem", description="OR-Tools CP-SAT. Weight/volume, groups, partial packing.", tags=["L1 - Packing"])
+    @instrument_solver("/optimize_packing", objective_path="metrics.bins_used")
+    async def ep_packing(request: PackingRequest, stream: bool = STREAM_QUERY) -> PackingResponse:
+        response = await _run_solver(_engine("packing.engine", "solve_packing"), request)
+        return ModelStreamingResponse(response) if stream else response
 
 # ─── L2 ───
 
-@app.post("/analyze_sensitivity", response_model=SensitivityResponse, operation_id="analyze_sensitivity",
-    summary="Parametric Sensitivity Analysis",
-    description="Perturbs parameters across any L1 solver. Returns sensitivity scores, elasticity, risk ranking.", tags=["L2 - Uncertainty"])
-@instrument_solver("/analyze_sensitivity", objective_path="baseline_objective")
-async def ep_sensitivity(request: SensitivityRequest) -> SensitivityResponse:
-    return run_sensitivity(request)
-
-@app.post("/optimize_robust", response_model=RobustResponse, operation_id="optimize_robust",
-    summary="Robust Optimization under Uncertainty",
-    description="Scenario-based worst-case protection. Modes: worst_case, percentile_90/95, regret_minimization.", tags=["L2 - Uncertainty"])
-@instrument_solver("/optimize_robust", objective_path="robust_solution.objective_value")
-async def ep_robust(request: RobustRequest) -> RobustResponse:
-    return run_robust(request)
-
-@app.post("/optimize_stochastic", response_model=StochasticResponse, operation_id="optimize_stochastic",
-    summary="Stochastic Optimization (Monte Carlo + CVaR)",
-    description="Monte Carlo simulation with CVaR risk metrics. Normal, uniform, triangular, log-normal distributions.", tags=["L2 - Uncertainty"])
-@instrument_solver("/optimize_stochastic", objective_path="recommended_objective")
-async def ep_stochastic(request: StochasticRequest) -> StochasticResponse:
-    return run_stochastic(request)
+if "sensitivity" in ENABLED_MODULES:
+    from sensitivity.models import SensitivityRequest, SensitivityResponse
+
+    @app.post("/analyze_sensitivity", response_model=SensitivityResponse, operation_id="analyze_sensitivity",
+        summary="Parametric Sensitivity Analysis",
+        description="Perturbs parameters across any L1 solver. Returns sensitivity scores, elasticity, risk ranking.", tags=["L2 - Uncertainty"])
+    @instrument_solver("/analyze_sensitivity", objective_path="baseline_objective")
+    def ep_sensitivity(request: SensitivityRequest) -> SensitivityResponse:
+        # Sync def: the analysis orchestrates in FastAPI's threadpool; its re-solves fan out
+        # to the sub-solve pool.
+        return _engine("sensitivity.engine", "analyze_sensitivity")(request)
+
+if "robust" in ENABLED_MODULES:
+    from robust.models import RobustRequest, RobustResponse
+
+    @app.post("/optimize_robust", response_model=RobustResponse, operation_id="optimize_robust",
+        summary="Robust Optimization under Uncertainty",
+        description="Scenario-based worst-case protection. Modes: worst_case, percentile_90/95, regret_minimization.", tags=["L2 - Uncertainty"])
+    @instrument_solver("/optimize_robust", objective_path="robust_solution.objective_value")
+    def ep_robust(request: RobustRequest) -> RobustResponse:
+        return _engine("robust.engine", "optimize_robust")(request)
+
+if "stochastic" in ENABLED_MODULES:
+    from stochastic.models import StochasticRequest, StochasticResponse
+
+    @app.post("/optimize_stochastic", response_model=StochasticResponse, operation_id="optimize_stochastic",
+        summary="Stochastic Optimization (Monte Carlo + CVaR)",
+        description="Monte Carlo simulation with CVaR risk metrics. Normal, uniform, triangular, log-normal distributions.", tags=["L2 - Uncertainty"])
+    @instrument_solver("/optimize_stochastic", objective_path="recommended_objective")
+    def ep_stochastic(request: StochasticRequest) -> StochasticResponse:
+        return _engine("stochastic.engine", "optimize_stochastic")(request)
 
 # ─── L2.5 ───
 
-@app.post("/optimize_pareto", response_model=ParetoResponse, operation_id="optimize_pareto",
-    summary="Multi-objective Pareto Frontier",
-    description="Generate Pareto frontier for 2-4 competing objectives. Trade-off analysis with correlation and spread.", tags=["L2.5 - Multi-objective"])
-@instrument_solver("/optimize_pareto")
-async def ep_pareto(request: ParetoRequest) -> ParetoResponse:
-    return run_pareto(request)
+if "pareto" in ENABLED_MODULES:
+    from pareto.models import ParetoRequest, ParetoResponse
+
+    @app.post("/optimize_pareto", response_model=ParetoResponse, operation_id="optimize_pareto",
+        summary="Multi-objective Pareto Frontier",
+        description="Generate Pareto frontier for 2-4 competing objectives. Trade-off analysis with correlation and spread.", tags=["L2.5 - Multi-objective"])
+    @instrument_solver("/optimize_pareto")
+    async def ep_pareto(request: ParetoRequest) -> ParetoResponse:
+        # Orchestrates from the threadpool (the per-weight solves fan out to the sub-solve
+        # pool), holding a solve slot for its lead solve.
+        return await _orchestrate_in_slot(_engine("pareto.engine", "optimize_pareto"), request)
 
 # ─── L3 ───
 
-@app.post("/prescriptive_advise", response_model=PrescriptiveResponse, operation_id="prescriptive_advise",
-    summary="Prescriptive Intelligence — Forecast + Optimize + Advise",
-    description=(
-        "Full prescriptive pipeline. Provide historical time series data for uncertain parameters. "
-        "The engine forecasts future values (exponential smoothing, moving average, linear trend, seasonal naive), "
-        "optimizes using forecasted values, assesses risk across conservative/moderate/aggressive scenarios, "
-        "and generates prioritized actionable recommendations. Supports 3 risk appetites."
-    ), tags=["L3 - Prescriptive"])
-@instrument_solver("/prescriptive_advise", objective_path="optimization.objective_value")
-async def ep_prescriptive(request: PrescriptiveRequest) -> PrescriptiveResponse:
-    return run_prescriptive(request)
+if "prescriptive" in ENABLED_MODULES:
+    from prescriptive.models import PrescriptiveRequest, PrescriptiveResponse
+
+    @app.post("/prescriptive_advise", response_model=PrescriptiveResponse, operation_id="prescriptive_advise",
+        summary="Prescriptive Intelligence — Forecast + Optimize + Advise",
+        description=(
+            "Full prescriptive pipeline. Provide historical time series data for uncertain parameters. "
+            "The engine forecasts future values (exponential smoothing, moving average, linear trend, seasonal naive), "
+            "optimizes using forecasted values, assesses risk across conservative/moderate/aggressive scenarios, "
+            "and generates prioritized actionable recommendations. Supports 3 risk appetites."
+        ), tags=["L3 - Prescriptive"])
+    @instrument_solver("/prescriptive_advise", objective_path="optimization.objective_value")
+    async def ep_prescriptive(request: PrescriptiveRequest) -> PrescriptiveResponse:
+        # Orchestrates from the threadpool (the scenario solves fan out to the sub-solve
+        # pool, or run inline when they collapse to one), holding a solve slot.
+        return await _orchestrate_in_slot(_engine("prescriptive.engine", "prescriptive_advise"), request)
 
 # ─── Error Handlers ───
 
+# Bodies are preallocated; the 422 one only splices in the (JSON-escaped) exception text.
+_422_HEAD = orjson.dumps({"status": "error", "message": "Invalid request format."})[:-1] + b',"details":'
+_500_BODY = orjson.dumps({"status": "error", "message": "Internal server error."})
+
 @app.exception_handler(422)
 async def err_422(request: Request, exc):
-    return JSONResponse(status_code=422, content={"status": "error", "message": "Invalid request format.", "details": str(exc)})
+    return Response(_422_HEAD + orjson.dumps(str(exc)) + b"}", status_code=422, media_type="application/json")
 
 @app.exception_handler(500)
 async def err_500(request: Request, exc):
-    return JSONResponse(status_code=500, content={"status": "error", "message": "Internal server error."})
+    return Response(_500_BODY, status_code=500, media_type="application/json")
 
 # ─── MCP ───
 
@@ -401,7 +580,7 @@ try:
             "All powered by Google OR-Tools."
         ), describe_all_responses=True, describe_full_response_schema=True)
     mcp.mount_sse(mount_path="/mcp")
-    print("✅ MCP server mounted at /mcp (SSE, open — free tier)")
+    logger.info("MCP server mounted at /mcp (SSE, open — free tier)")
 
     # ── MCP v2: Streamable HTTP + OAuth 2.1 ──
     if _SCALEKIT_READY:
@@ -417,7 +596,7 @@ try:
             auth_header = request.headers.get("Authorization", "")
             if not auth_header.startswith("Bearer "):
                 metadata_url = f"{os.environ.get('BASE_URL', 'https://optim-engine-production.up.railway.app')}/.well-known/oauth-protected-resource"
-                return JSONResponse(
+                return FastJSONResponse(
                     status_code=401,
                     content={"error": "unauthorized", "message": "Bearer token required"},
                     headers={"WWW-Authenticate": f'Bearer realm="OAuth", resource_metadata="{metadata_url}"'},
@@ -436,7 +615,7 @@ try:
                 )
             except Exception:
                 metadata_url = f"{os.environ.get('BASE_URL', 'https://optim-engine-production.up.railway.app')}/.well-known/oauth-protected-resource"
-                return JSONResponse(
+                return FastJSONResponse(
                     status_code=401,
                     content={"error": "invalid_token", "message": "Token validation failed"},
                     headers={"WWW-Authenticate": f'Bearer realm="OAuth", resource_metadata="{metadata_url}"'},
@@ -444,14 +623,20 @@ try:
             return await call_next(request)
 
         mcp.mount_http(mount_path="/mcp/v2")
-        print("✅ MCP v2 mounted at /mcp/v2 (Streamable HTTP + OAuth 2.1 via ScaleKit)")
+        logger.info("MCP v2 mounted at /mcp/v2 (Streamable HTTP + OAuth 2.1 via ScaleKit)")
     else:
-        print("⚠️  ScaleKit not configured — /mcp/v2 not mounted (missing SCALEKIT_* env vars)")
+        logger.warning("ScaleKit not configured — /mcp/v2 not mounted (missing SCALEKIT_* env vars)")
 except ImportError:
-    print("⚠️  fastapi-mcp not installed.")
+    logger.warning("fastapi-mcp not installed.")
 except Exception as e:
-    print(f"⚠️  MCP mount failed: {e}")
+    logger.warning("MCP mount failed: %s", e)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("api.server:app", host="0.0.0.0", port=int(os.environ.get("PORT", 8000)), reload=True)
+    dev = bool(os.environ.get("DEV"))
+    uvicorn.run(
+        "api.server:app", host="0.0.0.0", port=int(os.environ.get("PORT", 8000)),
+        loop="uvloop", http="httptools", log_config=None,
+        # --reload and multiple workers are mutually exclusive in uvicorn.
+        reload=dev, workers=1 if dev else int(os.environ.get("WORKERS", 1)),
+    )
@@ -1,3 +1,5 @@
 """OptimEngine Packing — Bin Packing via OR-Tools."""
 from .models import *  # noqa: F401,F403
-from .engine import solve_packing  # noqa: F401
+from solver.lazy import lazy_engine
+
+__getattr__ = lazy_engine(__name__, {"solve_packing": "engine"})
@@ -12,52 +12,210 @@ Supports:
 """
 
 import time
-from ortools.sat.python import cp_model
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+from ortools.sat.python import cp_model, cp_model_helper
 
 from .models import (
     PackingRequest, PackingResponse, PackingStatus, PackingObjective,
     PackedItem, BinSummary, PackingMetrics,
 )
+from solver import parallel
 
 
 def _expand_items(request: PackingRequest) -> list[dict]:
     """Expand items with quantity > 1 into individual items."""
-    expanded = []
-    for item in request.items:
-        for q in range(item.quantity):
-            suffix = f"_{q}" if item.quantity > 1 else ""
-            expanded.append({
-                "item_id": f"{item.item_id}{suffix}",
-                "original_id": item.item_id,
-                "name": item.name,
-                "weight": item.weight,
-                "volume": item.volume,
-                "value": item.value,
-                "group": item.group,
-            })
-    return expanded
+    return [
+        {
+            "item_id": f"{item.item_id}_{q}" if item.quantity > 1 else item.item_id,
+            "original_id": item.item_id,
+            "name": item.name,
+            "weight": item.weight,
+            "volume": item.volume,
+            "value": item.value,
+            "group": item.group,
+        }
+        for item in request.items
+        for q in range(item.quantity)
+    ]
 
 
 def _expand_bins(request: PackingRequest) -> list[dict]:
     """Expand bins with quantity > 1 into individual bins."""
-    expanded = []
-    for b in request.bins:
-        for q in range(b.quantity):
-            suffix = f"_{q}" if b.quantity > 1 else ""
-            expanded.append({
-                "bin_id": f"{b.bin_id}{suffix}",
-                "original_id": b.bin_id,
-                "name": b.name,
-                "weight_capacity": b.weight_capacity,
-                "volume_capacity": b.volume_capacity,
-                "max_items": b.max_items,
-                "cost": b.cost,
-            })
-    return expanded
-
-
-def solve_packing(request: PackingRequest) -> PackingResponse:
-    """Solve a bin packing problem using OR-Tools CP-SAT."""
+    return [
+        {
+            "bin_id": f"{b.bin_id}_{q}" if b.quantity > 1 else b.bin_id,
+            "original_id": b.bin_id,
+            "name": b.name,
+            "weight_capacity": b.weight_capacity,
+            "volume_capacity": b.volume_capacity,
+            "max_items": b.max_items,
+            "cost": b.cost,
+        }
+        for b in request.bins
+        for q in range(b.quantity)
+    ]
+
+
+# Assignment-matrix sizes (units x bins) at which the search set-up changes.
+SMALL_MODEL_CELLS = 1_000
+LARGE_MODEL_CELLS = 50_000
+
+
+def _tune_params(cells: int, light_presolve: bool) -> cp_model_helper.SatParameters:
+    """
+    CP-SAT parameters sized to the model. Small models are solved by a single worker
+    faster than a portfolio starts up; large ones get the full CPSAT_WORKERS budget (never
+    more: server concurrency is sized from it) and a stronger LP relaxation.
+    """
+    if cells < SMALL_MODEL_CELLS:
+        return _params_profile(1, None, light_presolve)
+    linearization = 2 if cells >= LARGE_MODEL_CELLS else None
+    return _params_profile(parallel.CPSAT_WORKERS, linearization, light_presolve)
+
+
+@lru_cache(maxsize=None)
+def _params_profile(num_workers: int, linearization_level: Optional[int],
+                    light_presolve: bool) -> cp_model_helper.SatParameters:
+    """Built once per distinct profile; solves copy it in with a single copy_from()."""
+    params = cp_model_helper.SatParameters()
+    params.num_workers = num_workers
+    params.log_search_progress = False
+    if linearization_level is not None:
+        params.linearization_level = linearization_level
+    if light_presolve:
+        params.cp_model_probing_level = 0
+        params.max_presolve_iterations = 1
+    return params
+
+
+def _group_units(items: list[dict], keep_groups_together: bool) -> list[list[int]]:
+    """
+    Partition item indices into assignment units: one per item, except that with
+    keep_groups_together all items of a group form one unit (they always share a bin,
+    so the model needs a single row of x for them instead of equality constraints).
+    """
+    if not keep_groups_together:
+        return [[i] for i in range(len(items))]
+    units: list[list[int]] = []
+    group_unit: dict[str, list[int]] = {}
+    for i, item in enumerate(items):
+        if not item["group"]:
+            units.append([i])
+        elif item["group"] in group_unit:
+            group_unit[item["group"]].append(i)
+        else:
+            group_unit[item["group"]] = [i]
+            units.append(group_unit[item["group"]])
+    return units
+
+
+def _hinted_assignment(hint: PackingResponse, items: list[dict], bins: list[dict],
+                       units: list[list[int]]) -> Optional[list[Optional[int]]]:
+    """
+    Unit -> bin index (None = unpacked) from a previous packing of a (slightly perturbed)
+    request. Bin summaries come one per expanded bin, in order, so they map back to bin
+    indices; item copies are matched by original ID (a group unit follows its first item).
+    None if the bin list no longer lines up.
+    """
+    if len(hint.bin_summaries) != len(bins) or any(
+        s.bin_id != b["original_id"] for s, b in zip(hint.bin_summaries, bins)
+    ):
+        return None
+
+    copies: dict[str, list[int]] = {}
+    for i in reversed(range(len(items))):
+        copies.setdefault(items[i]["original_id"], []).append(i)
+
+    assigned = {}
+    for j, summary in enumerate(hint.bin_summaries):
+        for item_id in summary.item_ids:
+            if copies.get(item_id):
+                assigned[copies[item_id].pop()] = j
+
+    return [assigned.get(members[0]) for members in units]
+
+
+def _first_fit_decreasing(bins: list[dict], weights: list[int], volumes: list[int],
+                          counts: list[int]) -> list[Optional[int]]:
+    """
+    Greedy unit -> bin index (None = did not fit): heaviest units first, each into the
+    first bin with weight, volume and item-count room left.
+    """
+    w_left = [b["weight_capacity"] for b in bins]
+    v_left = [b["volume_capacity"] if b["volume_capacity"] > 0 else None for b in bins]
+    n_left = [b["max_items"] for b in bins]
+
+    unit_bin: list[Optional[int]] = [None] * len(weights)
+    for r in sorted(range(len(weights)), key=lambda r: (-weights[r], -volumes[r])):
+        for j in range(len(bins)):
+            if (weights[r] <= w_left[j]
+                    and (v_left[j] is None or volumes[r] <= v_left[j])
+                    and (n_left[j] is None or counts[r] <= n_left[j])):
+                w_left[j] -= weights[r]
+                if v_left[j] is not None:
+                    v_left[j] -= volumes[r]
+                if n_left[j] is not None:
+                    n_left[j] -= counts[r]
+                unit_bin[r] = j
+                break
+    return unit_bin
+
+
+def _precheck_feasibility(items: list[dict], bins: list[dict], units: list[list[int]], weights: list[int],
+                          volumes: list[int], counts: list[int]) -> Optional[str]:
+    """
+    Checks that prove a full packing impossible without calling CP-SAT: a unit (item or
+    kept-together group) that fits no bin on its own, or totals above the combined
+    capacity. Returns the reason, or None if undecided.
+
+    The fit check is O(units x bin types): a unit must fit weight, volume and item count
+    of one bin at once, so it is tested against each distinct capacity profile (bins
+    expanded from `quantity` share one) rather than against per-dimension maxima.
+    """
+    profiles = {(b["weight_capacity"], b["volume_capacity"], b["max_items"]) for b in bins}
+    for r, members in enumerate(units):
+        if not any(
+            weights[r] <= weight_cap
+            and (volume_cap == 0 or volumes[r] <= volume_cap)
+            and (max_items is None or counts[r] <= max_items)
+            for weight_cap, volume_cap, max_items in profiles
+        ):
+            first = items[members[0]]
+            what = f"Group '{first['group']}'" if len(members) > 1 else f"Item '{first['original_id']}'"
+            return f"{what} does not fit in any bin."
+
+    if sum(weights) > sum(b["weight_capacity"] for b in bins):
+        return "Total item weight exceeds total bin capacity."
+    if all(b["volume_capacity"] > 0 for b in bins) and sum(volumes) > sum(b["volume_capacity"] for b in bins):
+        return "Total item volume exceeds total bin capacity."
+    if all(b["max_items"] is not None for b in bins) and sum(counts) > sum(b["max_items"] for b in bins):
+        return "More items than the bins' combined max_items."
+    return None
+
+
+def _add_solution_hints(model, unit_bin: list[Optional[int]], x: list[list], y: dict, packed: dict) -> None:
+    """Hint every x/y/packed variable from a unit -> bin index assignment."""
+    for r, row in enumerate(x):
+        for j, var in enumerate(row):
+            model.add_hint(var, unit_bin[r] == j)
+    for r, var in packed.items():
+        model.add_hint(var, unit_bin[r] is not None)
+    used = set(unit_bin)
+    for j, var in y.items():
+        model.add_hint(var, j in used)
+
+
+def solve_packing(request: PackingRequest, hint: Optional[PackingResponse] = None,
+                  light_presolve: bool = False) -> PackingResponse:
+    """
+    Solve a bin packing problem using OR-Tools CP-SAT.
+    hint: optional previous solution (same items/bins) used as a CP-SAT warm start;
+        without one, a first-fit-decreasing packing is hinted instead.
+    light_presolve: cheap presolve for re-solves of a model that was just solved in full.
+    """
     t0 = time.time()
 
     try:
@@ -77,110 +235,122 @@ def solve_packing(request: PackingRequest) -> PackingResponse:
                 message="No bins available."
             )
 
+        units = _group_units(items, request.keep_groups_together)
+        n_units = len(units)
+        weights = [sum(items[i]["weight"] for i in members) for members in units]
+        volumes = [sum(items[i]["volume"] for i in members) for members in units]
+        values = [sum(items[i]["value"] for i in members) for members in units]
+        counts = [len(members) for members in units]
+
+        if not request.allow_partial:
+            reason = _precheck_feasibility(items, bins, units, weights, volumes, counts)
+            if reason is not None:
+                return PackingResponse(
+                    status=PackingStatus.NO_SOLUTION,
+                    message=f"No feasible packing: {reason} Try adding bins or enabling allow_partial=True."
+                )
+
         model = cp_model.CpModel()
 
         # ── Variables ──
-        # x[i][j] = 1 if item i is assigned to bin j
-        x = {}
-        for i in range(n_items):
-            for j in range(n_bins):
-                x[(i, j)] = model.new_bool_var(f"x_{i}_{j}")
-
-        # y[j] = 1 if bin j is used
+        # Variables are unnamed: names are only for debugging, and formatting one per
+        # variable is a measurable share of model build on large instances.
+        # x[r][j] = 1 if unit r (an item, or a kept-together group) is assigned to bin j
+        x = [[model.new_bool_var("") for _ in range(n_bins)] for _ in range(n_units)]
+
+        # y[j] = 1 if bin j is used. Only built when the objective or the symmetry
+        # breaking between bin copies refers to it.
+        has_copies = any(b["original_id"] == a["original_id"] for a, b in zip(bins, bins[1:]))
         y = {}
-        for j in range(n_bins):
-            y[j] = model.new_bool_var(f"y_{j}")
+        if has_copies or request.objective == PackingObjective.MINIMIZE_BINS:
+            for j in range(n_bins):
+                y[j] = model.new_bool_var("")
 
-        # packed[i] = 1 if item i is packed (for partial packing)
+        # packed[r] = 1 if unit r is packed. Only needed for partial packing: otherwise
+        # every unit is packed and its bin row simply sums to 1.
         packed = {}
-        for i in range(n_items):
-            packed[i] = model.new_bool_var(f"packed_{i}")
+        if request.allow_partial:
+            for r in range(n_units):
+                packed[r] = model.new_bool_var("")
 
         # ── Constraints ──
-
-        # Each item assigned to at most one bin
-        for i in range(n_items):
-            bin_assignments = [x[(i, j)] for j in range(n_bins)]
-            model.add(sum(bin_assignments) == packed[i])
-
-        # If not allowing partial packing, all items must be packed
-        if not request.allow_partial:
-            for i in range(n_items):
-                model.add(packed[i] == 1)
+        # Expressions are built with LinearExpr.sum / weighted_sum (assembled in C++)
+        # rather than Python sum() over per-term products.
+        LinearExpr = cp_model.LinearExpr
+        bin_vars = [list(col) for col in zip(*x)]
+
+        # Each unit goes to exactly one bin; with partial packing, to one bin or to
+        # "not packed" (exactly one of x[r] + [not packed[r]]), which keeps it a pure
+        # boolean constraint CP-SAT propagates natively.
+        for r in range(n_units):
+            if packed:
+                model.add_exactly_one(x[r] + [packed[r].Not()])
+            else:
+                model.add_exactly_one(x[r])
 
         # Weight capacity per bin
         for j in range(n_bins):
-            model.add(
-                sum(items[i]["weight"] * x[(i, j)] for i in range(n_items))
-                <= bins[j]["weight_capacity"]
-            )
+            model.add(LinearExpr.weighted_sum(bin_vars[j], weights) <= bins[j]["weight_capacity"])
 
         # Volume capacity per bin (if specified)
         for j in range(n_bins):
             if bins[j]["volume_capacity"] > 0:
-                model.add(
-                    sum(items[i]["volume"] * x[(i, j)] for i in range(n_items))
-                    <= bins[j]["volume_capacity"]
-                )
+                model.add(LinearExpr.weighted_sum(bin_vars[j], volumes) <= bins[j]["volume_capacity"])
 
         # Max items per bin (if specified)
         for j in range(n_bins):
             if bins[j]["max_items"] is not None:
-                model.add(
-                    sum(x[(i, j)] for i in range(n_items))
-                    <= bins[j]["max_items"]
-                )
+                model.add(LinearExpr.weighted_sum(bin_vars[j], counts) <= bins[j]["max_items"])
 
-        # Link y[j] to x: if any item in bin j, y[j] = 1
-        for j in range(n_bins):
-            for i in range(n_items):
-                model.add(y[j] >= x[(i, j)])
-            model.add(y[j] <= sum(x[(i, j)] for i in range(n_items)))
-
-        # Group constraints: items with same group go to same bin
-        if request.keep_groups_together:
-            groups = {}
-            for i, item in enumerate(items):
-                if item["group"]:
-                    groups.setdefault(item["group"], []).append(i)
-
-            for group_name, group_items in groups.items():
-                if len(group_items) > 1:
-                    first = group_items[0]
-                    for other in group_items[1:]:
-                        for j in range(n_bins):
-                            model.add(x[(first, j)] == x[(other, j)])
+        # Link y[j] to x: y[j] = 1 iff any item is in bin j (one constraint per bin)
+        for j in y:
+            model.add_max_equality(y[j], bin_vars[j])
+
+        # Symmetry breaking: copies of one bin type (quantity > 1) are interchangeable,
+        # so only solutions that use them in order are kept.
+        if has_copies:
+            for j in range(1, n_bins):
+                if bins[j]["original_id"] == bins[j - 1]["original_id"]:
+                    model.add_implication(y[j], y[j - 1])
 
         # ── Objective ──
         if request.objective == PackingObjective.MINIMIZE_BINS:
-            model.minimize(sum(bins[j]["cost"] * y[j] for j in range(n_bins)))
+            model.minimize(LinearExpr.weighted_sum([y[j] for j in range(n_bins)], [b["cost"] for b in bins]))
 
+        # Without partial packing everything is packed, so value and item count are
+        # constants and the solve is a pure feasibility check.
         elif request.objective == PackingObjective.MAXIMIZE_VALUE:
-            model.maximize(
-                sum(items[i]["value"] * packed[i] for i in range(n_items))
-            )
+            if packed:
+                model.maximize(LinearExpr.weighted_sum([packed[r] for r in range(n_units)], values))
 
         elif request.objective == PackingObjective.MAXIMIZE_ITEMS:
-            model.maximize(sum(packed[i] for i in range(n_items)))
+            if packed:
+                model.maximize(LinearExpr.weighted_sum([packed[r] for r in range(n_units)], counts))
 
         elif request.objective == PackingObjective.BALANCE_LOAD:
-            # Minimize max weight utilization across used bins
-            max_load = model.new_int_var(0, max(b["weight_capacity"] for b in bins) * 100, "max_load")
+            # Minimize the max weight utilization (in basis points) across bins.
+            # load_j / cap_j <= max_load / 10000 is linear since cap_j is constant;
+            # unused bins carry no load and never bind.
+            max_load = model.new_int_var(0, 10000, "")
+            scaled_weights = [w * 10000 for w in weights]
             for j in range(n_bins):
-                cap = bins[j]["weight_capacity"]
-                if cap > 0:
-                    load_pct = model.new_int_var(0, 10000, f"load_pct_{j}")
-                    total_weight = sum(items[i]["weight"] * x[(i, j)] for i in range(n_items))
-                    model.add(load_pct * cap == total_weight * 100).only_enforce_if(y[j])
-                    model.add(load_pct == 0).only_enforce_if(y[j].Not())
-                    model.add(max_load >= load_pct)
+                model.add(LinearExpr.weighted_sum(bin_vars[j], scaled_weights) <= max_load * bins[j]["weight_capacity"])
             model.minimize(max_load)
 
+        # ── Warm start ──
+        # The previous solution if one was passed in and still lines up, else first-fit
+        # decreasing, so CP-SAT starts from a full assignment rather than from scratch.
+        unit_bin = None
+        if hint is not None and hint.bin_summaries:
+            unit_bin = _hinted_assignment(hint, items, bins, units)
+        if unit_bin is None:
+            unit_bin = _first_fit_decreasing(bins, weights, volumes, counts)
+        _add_solution_hints(model, unit_bin, x, y, packed)
+
         # ── Solve ──
         solver = cp_model.CpSolver()
+        solver.parameters.copy_from(_tune_params(n_units * n_bins, light_presolve))
         solver.parameters.max_time_in_seconds = request.max_solve_time_seconds
-        solver.parameters.num_workers = 4
-        solver.parameters.log_search_progress = False
 
         status = solver.solve(model)
         solve_time = time.time() - t0
@@ -188,30 +358,45 @@ def solve_packing(request: PackingRequest) -> PackingResponse:
         if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
             solver_status = PackingStatus.OPTIMAL if status == cp_model.OPTIMAL else PackingStatus.FEASIBLE
 
-            # Extract assignments
-            assignments = []
-            bin_items = {j: [] for j in range(n_bins)}
-
-            for i in range(n_items):
-                for j in range(n_bins):
-                    if solver.value(x[(i, j)]) == 1:
-                        assignments.append(PackedItem(
-                            item_id=items[i]["original_id"],
-                            name=items[i]["name"],
-                            bin_id=bins[j]["original_id"],
-                            bin_name=bins[j]["name"],
-                            weight=items[i]["weight"],
-                            volume=items[i]["volume"],
-                            value=items[i]["value"],
-                        ))
-                        bin_items[j].append(i)
+            # Extract assignments: each unit's bin is broadcast to its member items.
+            # Values are read from the solution array in one call, not per variable.
+            solution = list(solver.response_proto.solution)
+            solved_bin = {}
+            for r, row in enumerate(x):
+                for j, var in enumerate(row):
+                    if solution[var.index]:
+                        solved_bin[r] = j
                         break
 
-            # Unpacked items
+            unit_of = {i: r for r, members in enumerate(units) for i in members}
+            assignments = []
+            bin_items = {j: [] for j in range(n_bins)}
             unpacked = []
+
             for i in range(n_items):
-                if solver.value(packed[i]) == 0:
+                j = solved_bin.get(unit_of[i])
+                if j is None:
                     unpacked.append(items[i]["original_id"])
+                    continue
+                assignments.append(PackedItem(
+                    item_id=items[i]["original_id"],
+                    name=items[i]["name"],
+                    bin_id=bins[j]["original_id"],
+                    bin_name=bins[j]["name"],
+                    weight=items[i]["weight"],
+                    volume=items[i]["volume"],
+                    value=items[i]["value"],
+                ))
+                bin_items[j].append(i)
+
+            # Per-bin weight/volume/value loads, summed over the packed units in one pass
+            bin_of_unit = np.array([solved_bin.get(r, -1) for r in range(n_units)], dtype=np.int64)
+            on = bin_of_unit >= 0
+            unit_loads = np.array([weights, volumes, values], dtype=np.int64)
+            loads = np.zeros((3, n_bins), dtype=np.int64)
+            np.add.at(loads, (slice(None), bin_of_unit[on]), unit_loads[:, on])
+            w_loads, v_loads, val_loads = loads.tolist()
+            total_weight, total_volume, total_value = loads.sum(axis=1).tolist()
 
             # Bin summaries
             bin_summaries = []
@@ -220,11 +405,9 @@ def solve_packing(request: PackingRequest) -> PackingResponse:
             volume_utils = []
 
             for j in range(n_bins):
-                is_used = solver.value(y[j]) == 1
+                is_used = bool(bin_items[j])
                 packed_indices = bin_items[j]
-                w_used = sum(items[i]["weight"] for i in packed_indices)
-                v_used = sum(items[i]["volume"] for i in packed_indices)
-                val = sum(items[i]["value"] for i in packed_indices)
+                w_used, v_used, val = w_loads[j], v_loads[j], val_loads[j]
                 w_cap = bins[j]["weight_capacity"]
                 v_cap = bins[j]["volume_capacity"]
                 w_pct = round(w_used / w_cap * 100, 1) if w_cap > 0 else 0
@@ -258,9 +441,9 @@ def solve_packing(request: PackingRequest) -> PackingResponse:
                 items_packed=len(assignments),
                 items_unpacked=len(unpacked),
                 unpacked_item_ids=unpacked,
-                total_value_packed=sum(a.value for a in assignments),
-                total_weight_packed=sum(a.weight for a in assignments),
-                total_volume_packed=sum(a.volume for a in assignments),
+                total_value_packed=total_value,
+                total_weight_packed=total_weight,
+                total_volume_packed=total_volume,
                 avg_weight_utilization_pct=round(sum(weight_utils) / len(weight_utils), 1) if weight_utils else 0,
                 avg_volume_utilization_pct=round(sum(volume_utils) / len(volume_utils), 1) if volume_utils else 0,
                 total_bin_cost=total_bin_cost,
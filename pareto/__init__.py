@@ -1,3 +1,5 @@
 """OptimEngine Pareto — Multi-objective Optimization with Pareto Frontier."""
 from .models import *  # noqa: F401,F403
-from .engine import optimize_pareto  # noqa: F401
+from solver.lazy import lazy_engine
+
+__getattr__ = lazy_engine(__name__, {"optimize_pareto": "engine"})
@@ -5,16 +5,16 @@ Approach: Weighted-sum scalarization.
 1. For N objectives and K requested points, generate weight vectors
 2. Always include extreme points (100% weight on each objective)
 3. Fill remaining with evenly distributed weight combinations
-4. Solve each weight combination as a single-objective problem
+4. Solve each weight combination as a single-objective problem (in parallel)
 5. Filter dominated solutions to produce the Pareto frontier
 6. Analyze trade-offs between objective pairs
 """
 
-import copy
 import itertools
-import math
 import time
-from typing import Any
+from typing import Any, Callable
+
+import numpy as np
 
 from .models import (
     ParetoRequest, ParetoResponse, ParetoSolverType,
@@ -27,29 +27,33 @@ from routing.models import RoutingRequest
 from routing.engine import solve_routing
 from packing.models import PackingRequest
 from packing.engine import solve_packing
+from solver.parallel import map_solves
 
 
 # ─── Objective extraction ───
 
+# Metrics models declare every field with a default, so a present metrics object can be
+# read directly. Objectives whose metric the L1 engine does not report read as 0.
+
 SCHEDULING_OBJECTIVES = {
     "minimize_makespan": lambda r: r.metrics.makespan if r.metrics else 0,
-    "minimize_total_tardiness": lambda r: r.metrics.total_tardiness if r.metrics and hasattr(r.metrics, "total_tardiness") else 0,
-    "minimize_total_completion_time": lambda r: r.metrics.total_completion_time if r.metrics and hasattr(r.metrics, "total_completion_time") else 0,
-    "maximize_machine_utilization": lambda r: -(r.metrics.avg_machine_utilization if r.metrics and hasattr(r.metrics, "avg_machine_utilization") else 0),
+    "minimize_total_tardiness": lambda r: r.metrics.total_tardiness if r.metrics else 0,
+    "minimize_total_completion_time": lambda r: 0,  # not in ScheduleMetrics
+    "maximize_machine_utilization": lambda r: -(r.metrics.avg_machine_utilization_pct if r.metrics else 0),
 }
 
 ROUTING_OBJECTIVES = {
     "minimize_total_distance": lambda r: r.metrics.total_distance if r.metrics else 0,
     "minimize_num_vehicles": lambda r: r.metrics.vehicles_used if r.metrics else 0,
-    "minimize_longest_route": lambda r: r.metrics.longest_route_distance if r.metrics and hasattr(r.metrics, "longest_route_distance") else 0,
-    "minimize_total_time": lambda r: r.metrics.total_time if r.metrics and hasattr(r.metrics, "total_time") else 0,
+    "minimize_longest_route": lambda r: r.metrics.max_route_distance if r.metrics else 0,
+    "minimize_total_time": lambda r: r.metrics.total_time if r.metrics else 0,
 }
 
 PACKING_OBJECTIVES = {
     "minimize_bins": lambda r: r.metrics.bins_used if r.metrics else 0,
     "maximize_items": lambda r: -(r.metrics.items_packed if r.metrics else 0),
-    "maximize_value": lambda r: -(r.metrics.total_value if r.metrics and hasattr(r.metrics, "total_value") else 0),
-    "minimize_waste": lambda r: r.metrics.total_waste_pct if r.metrics and hasattr(r.metrics, "total_waste_pct") else 0,
+    "maximize_value": lambda r: -(r.metrics.total_value_packed if r.metrics else 0),
+    "minimize_waste": lambda r: 0,  # not in PackingMetrics
 }
 
 
@@ -63,202 +67,204 @@ def _get_objective_map(solver_type: ParetoSolverType):
     return {}
 
 
-def _extract_objectives(solver_type, objectives, response):
-    """Extract all objective values from a solver response."""
-    obj_map = _get_objective_map(solver_type)
-    result = {}
-    for obj in objectives:
-        extractor = obj_map.get(obj.name)
-        if extractor:
-            val = extractor(response)
-            # For maximization objectives stored as negative, flip sign for display
-            if obj.name.startswith("maximize_"):
-                result[obj.name] = -val
-            else:
-                result[obj.name] = float(val)
-        else:
-            result[obj.name] = 0.0
-    return result
+def _extract_objectives(extractors: list[tuple[str, Callable, bool]], response) -> dict[str, float]:
+    """Extract all objective values from a solver response, given (name, extractor, is_max) triples."""
+    # Maximization objectives are extracted as negative; flip the sign back for display
+    return {name: -fn(response) if is_max else float(fn(response)) for name, fn, is_max in extractors}
 
 
 # ─── Weight generation ───
 
-def _generate_weight_vectors(objectives: list[ObjectiveSpec], num_points: int) -> list[dict[str, float]]:
+def _generate_weight_vectors(objectives: list[ObjectiveSpec], num_points: int) -> np.ndarray:
     """
     Generate weight vectors for weighted-sum scalarization.
     Always includes extreme points and balanced point.
+    Returns a (points, objectives) array; columns follow the order of `objectives`.
     """
     n = len(objectives)
-    vectors = []
 
     # Extreme points: 100% weight on each objective
-    for i, obj in enumerate(objectives):
-        w = {o.name: 0.0 for o in objectives}
-        w[obj.name] = 1.0
-        vectors.append(w)
+    vectors = np.eye(n)
 
     # Balanced point: equal weights (adjusted by user-specified weights)
-    total_w = sum(o.weight for o in objectives)
-    balanced = {o.name: o.weight / total_w for o in objectives}
-    vectors.append(balanced)
+    user_weights = np.array([o.weight for o in objectives], dtype=np.float64)
+    vectors = np.vstack([vectors, user_weights / user_weights.sum()])
 
     # Fill remaining with systematic weight combinations
     remaining = num_points - len(vectors)
     if remaining > 0 and n == 2:
         # For 2 objectives, evenly spaced weights
-        for i in range(1, remaining + 1):
-            alpha = i / (remaining + 1)
-            w = {objectives[0].name: alpha, objectives[1].name: 1 - alpha}
-            vectors.append(w)
+        alpha = np.arange(1, remaining + 1) / (remaining + 1)
+        vectors = np.vstack([vectors, np.column_stack([alpha, 1 - alpha])])
 
     elif remaining > 0 and n >= 3:
         # For 3+ objectives, simplex grid
         steps = max(2, int(remaining ** (1 / (n - 1))))
-        grid = []
-        for combo in itertools.product(range(steps + 1), repeat=n):
-            if sum(combo) == steps:
-                w = {objectives[i].name: combo[i] / steps for i in range(n)}
-                grid.append(w)
-
-        # Remove duplicates of extreme/balanced
-        for g in grid:
-            is_dup = False
-            for v in vectors:
-                if all(abs(g[k] - v[k]) < 0.01 for k in g):
-                    is_dup = True
-                    break
-            if not is_dup:
-                vectors.append(g)
-            if len(vectors) >= num_points:
-                break
+        combos = np.indices((steps + 1,) * n).reshape(n, -1).T
+        grid = combos[combos.sum(axis=1) == steps] / steps
+
+        # Remove duplicates of extreme/balanced (grid points are >= 1/steps apart from each other)
+        distance = np.abs(grid[:, None, :] - vectors[None, :, :]).max(axis=2)
+        vectors = np.vstack([vectors, grid[distance.min(axis=1) >= 0.01][:remaining]])
 
     return vectors[:num_points]
 
 
 # ─── Solver dispatch ───
 
-def _solve_with_objective(solver_type, request_data, objective_name, max_time):
-    """Solve with a specific primary objective."""
-    data = copy.deepcopy(request_data)
-    data["objective"] = objective_name
-    data["max_solve_time_seconds"] = max_time
+_SOLVERS = {
+    ParetoSolverType.SCHEDULING: (ScheduleRequest, solve_schedule),
+    ParetoSolverType.ROUTING: (RoutingRequest, solve_routing),
+    ParetoSolverType.PACKING: (PackingRequest, solve_packing),
+}
 
-    if solver_type == ParetoSolverType.SCHEDULING:
-        req = ScheduleRequest(**data)
-        resp = solve_schedule(req)
-        return resp, resp.status.value
 
-    elif solver_type == ParetoSolverType.ROUTING:
-        req = RoutingRequest(**data)
-        resp = solve_routing(req)
-        return resp, resp.status.value
+def _parse_request(solver_type, request_data, max_time):
+    """Validate the L1 request once per Pareto run; the objective is set per weight vector."""
+    if solver_type not in _SOLVERS:
+        raise ValueError(f"Unknown solver: {solver_type}")
+    request_cls, _ = _SOLVERS[solver_type]
+    data = {k: v for k, v in request_data.items() if k != "objective"}
+    data["max_solve_time_seconds"] = max_time
+    return request_cls(**data)
 
-    elif solver_type == ParetoSolverType.PACKING:
-        req = PackingRequest(**data)
-        resp = solve_packing(req)
-        return resp, resp.status.value
 
-    raise ValueError(f"Unknown solver: {solver_type}")
+def _solve_with_objective(solver_type, base_request, objective_name, hint=None):
+    """Solve the parsed request with a specific primary objective, optionally warm-started."""
+    _, solve = _SOLVERS[solver_type]
+    objective_type = type(base_request).model_fields["objective"].annotation
+    # Only the objective changes between points: a shallow copy shares every other field.
+    req = base_request.model_copy(update={"objective": objective_type(objective_name)})
+    resp = solve(req, hint=hint)
+    return resp, resp.status.value
 
 
 # ─── Dominance filtering ───
 
-def _is_dominated(point_a: dict[str, float], point_b: dict[str, float], minimize_keys: set) -> bool:
-    """Check if point_a is dominated by point_b (b is at least as good in all, strictly better in one)."""
-    at_least_as_good = True
-    strictly_better = False
+# Below this many points a pairwise scalar check beats building the NumPy arrays.
+SCALAR_FRONT_MAX_POINTS = 8
 
-    for key in point_a:
-        a_val = point_a[key]
-        b_val = point_b[key]
 
-        if key in minimize_keys:
-            # Lower is better
-            if b_val > a_val:
-                at_least_as_good = False
-            if b_val < a_val:
-                strictly_better = True
-        else:
-            # Higher is better
-            if b_val < a_val:
-                at_least_as_good = False
-            if b_val > a_val:
-                strictly_better = True
-
-    return at_least_as_good and strictly_better
-
-
-def _filter_pareto_frontier(points: list[ParetoPoint], objectives: list[ObjectiveSpec]) -> list[ParetoPoint]:
-    """Remove dominated points."""
-    minimize_keys = {o.name for o in objectives if o.name.startswith("minimize_")}
-    frontier = []
-
-    for i, p in enumerate(points):
-        if not p.feasible:
-            continue
-        dominated = False
-        for j, q in enumerate(points):
-            if i == j or not q.feasible:
-                continue
-            if _is_dominated(p.objectives, q.objectives, minimize_keys):
-                dominated = True
-                break
-        if not dominated:
-            frontier.append(p)
+def _objective_signs(objectives: list[ObjectiveSpec]) -> np.ndarray:
+    """+1 for minimize_* objectives, -1 for maximize_*: values * signs is lower-is-better."""
+    return np.array([1.0 if o.name.startswith("minimize_") else -1.0 for o in objectives])
 
-    return frontier
 
+def _objective_matrix(points: list[ParetoPoint], names: list[str]) -> np.ndarray:
+    """(N, d) objective values, one row per point and one column per objective."""
+    return np.array(
+        [[p.objectives.get(name, 0) for name in names] for p in points], dtype=np.float64,
+    ).reshape(len(points), len(names))
 
-# ─── Trade-off analysis ───
 
-def _analyze_trade_offs(frontier: list[ParetoPoint], objectives: list[ObjectiveSpec]) -> list[TradeOff]:
-    """Compute pairwise trade-off analysis."""
-    trade_offs = []
-    obj_names = [o.name for o in objectives]
+def _is_dominated(loss_a: list[float], loss_b: list[float]) -> bool:
+    """Check if loss row a is dominated by row b (b is no worse anywhere, strictly better once)."""
+    strictly_better = False
+    for a_val, b_val in zip(loss_a, loss_b):
+        if b_val > a_val:
+            return False  # b is worse on this axis: no dominance, stop here
+        if b_val < a_val:
+            strictly_better = True
+    return strictly_better
+
+
+def _pareto_front_mask(loss: np.ndarray) -> np.ndarray:
+    """
+    Boolean mask of the non-dominated rows of a (N, d) loss matrix (lexsort sweep).
+    After a lexicographic sort the first remaining row is never dominated: it is kept
+    with its exact duplicates, and every row that is no better on any axis is dropped.
+    """
+    n = loss.shape[0]
+    on_front = np.zeros(n, dtype=bool)
+    order = np.lexsort(loss.T[::-1])
+    remaining = loss[order]
+    while len(order):
+        head = remaining[0]
+        on_front[order[np.all(remaining == head, axis=1)]] = True
+        keep = np.any(remaining < head, axis=1)
+        remaining, order = remaining[keep], order[keep]
+    return on_front
+
+
+def _pareto_front_mask_2d(loss: np.ndarray) -> np.ndarray:
+    """
+    _pareto_front_mask for two objectives in O(N log N): after sorting by (f1, f2) a row
+    is dominated iff an earlier row has a smaller f2, or a row with a smaller f1 has an
+    f2 no larger (running minimum of f2, read at the start of each f1 tie group).
+    """
+    order = np.lexsort((loss[:, 1], loss[:, 0]))
+    f1, f2 = loss[order, 0], loss[order, 1]
+    prev_min = np.concatenate(([np.inf], np.minimum.accumulate(f2)[:-1]))
+    group_start = np.searchsorted(f1, f1, side="left")
+    dominated = (prev_min < f2) | (prev_min[group_start] <= f2)
+    on_front = np.empty(len(order), dtype=bool)
+    on_front[order] = ~dominated
+    return on_front
+
+
+def _frontier_mask(loss: np.ndarray) -> np.ndarray:
+    """Non-dominated rows of a (N, d) loss matrix (ties are kept: equal rows do not dominate each other)."""
+    n = loss.shape[0]
+    if n <= 1:
+        return np.ones(n, dtype=bool)
+    # Weight vectors sharing a primary objective share a solve, so rows repeat heavily:
+    # filter the distinct rows and broadcast the verdict back to their duplicates.
+    rows, inverse = np.unique(loss, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    m = rows.shape[0]
+    if m == 1:
+        return np.ones(n, dtype=bool)
+    if m < SCALAR_FRONT_MAX_POINTS:
+        distinct = rows.tolist()
+        on_front = np.array(
+            [not any(_is_dominated(distinct[i], distinct[j]) for j in range(m) if j != i) for i in range(m)],
+            dtype=bool,
+        )
+    elif rows.shape[1] == 2:
+        on_front = _pareto_front_mask_2d(rows)
+    else:
+        on_front = _pareto_front_mask(rows)
+    return on_front[inverse]
 
-    for i in range(len(obj_names)):
-        for j in range(i + 1, len(obj_names)):
-            a_name = obj_names[i]
-            b_name = obj_names[j]
 
-            a_vals = [p.objectives.get(a_name, 0) for p in frontier]
-            b_vals = [p.objectives.get(b_name, 0) for p in frontier]
+# ─── Trade-off analysis ───
 
-            if len(a_vals) < 2:
-                continue
+def _analyze_trade_offs(values: np.ndarray, obj_names: list[str]) -> list[TradeOff]:
+    """Compute pairwise trade-off analysis over the (points, objectives) frontier matrix."""
+    if values.shape[0] < 2:
+        return []
+
+    # One correlation matrix and one range per objective replace per-pair Python
+    # reductions. Population statistics; a constant objective has zero correlation
+    # with everything.
+    values = values.T
+    centered = values - values.mean(axis=1, keepdims=True)
+    cov = centered @ centered.T / values.shape[1]
+    std = np.sqrt(np.clip(np.diag(cov), 0, None))
+    denom = np.outer(std, std)
+    corr = np.divide(cov, denom, out=np.zeros_like(cov), where=denom > 0)
+    ranges = values.max(axis=1) - values.min(axis=1)
 
-            # Correlation
-            n = len(a_vals)
-            mean_a = sum(a_vals) / n
-            mean_b = sum(b_vals) / n
-            var_a = sum((x - mean_a) ** 2 for x in a_vals) / n
-            var_b = sum((x - mean_b) ** 2 for x in b_vals) / n
-            cov = sum((a_vals[k] - mean_a) * (b_vals[k] - mean_b) for k in range(n)) / n
-
-            std_a = math.sqrt(var_a) if var_a > 0 else 0
-            std_b = math.sqrt(var_b) if var_b > 0 else 0
-            corr = cov / (std_a * std_b) if std_a > 0 and std_b > 0 else 0
-
-            # Trade-off ratio
-            range_a = max(a_vals) - min(a_vals) if a_vals else 0
-            range_b = max(b_vals) - min(b_vals) if b_vals else 0
-            ratio = range_b / range_a if range_a > 0 else 0
-
-            # Relationship
-            if corr < -0.3:
-                rel = "conflict"
-            elif corr > 0.3:
-                rel = "synergy"
-            else:
-                rel = "independent"
-
-            trade_offs.append(TradeOff(
-                objective_a=a_name,
-                objective_b=b_name,
-                correlation=round(corr, 3),
-                trade_off_ratio=round(ratio, 3),
-                relationship=rel,
-            ))
+    trade_offs = []
+    for i, j in itertools.combinations(range(len(obj_names)), 2):
+        c = float(corr[i, j])
+        ratio = float(ranges[j] / ranges[i]) if ranges[i] > 0 else 0
+
+        # Relationship
+        if c < -0.3:
+            rel = "conflict"
+        elif c > 0.3:
+            rel = "synergy"
+        else:
+            rel = "independent"
+
+        trade_offs.append(TradeOff(
+            objective_a=obj_names[i],
+            objective_b=obj_names[j],
+            correlation=round(c, 3),
+            trade_off_ratio=round(ratio, 3),
+            relationship=rel,
+        ))
 
     return trade_offs
 
@@ -279,25 +285,48 @@ def optimize_pareto(request: ParetoRequest) -> ParetoResponse:
                     status="error",
                     message=f"Unknown objective '{obj.name}' for solver '{request.solver_type.value}'. Available: {list(obj_map.keys())}",
                 )
+        extractors = [(o.name, obj_map[o.name], o.name.startswith("maximize_")) for o in request.objectives]
+
+        # The L1 problem is the same for every point: parse and validate it once
+        try:
+            base_request = _parse_request(
+                request.solver_type, request.solver_request, request.max_solve_time_seconds,
+            )
+        except Exception as e:
+            return ParetoResponse(
+                status="error",
+                message=f"Invalid solver_request for '{request.solver_type.value}': {e}",
+            )
 
         # Generate weight vectors
         weights = _generate_weight_vectors(request.objectives, request.num_points)
 
         # Solve for each weight vector
-        # Strategy: use the objective with highest weight as the primary solver objective
-        all_points = []
-
-        for idx, w in enumerate(weights):
-            # Pick primary objective (highest weight)
-            primary = max(w, key=w.get)
+        # Strategy: use the objective with highest weight as the primary solver objective.
+        # Vectors sharing a primary objective dispatch the same solve, so each distinct
+        # primary is solved once. The solves are independent: the first is solved on its own
+        # and its solution warm-starts all the others (same problem, new objective), which
+        # run in parallel.
+        obj_names = [o.name for o in request.objectives]
+        primaries = [obj_names[i] for i in weights.argmax(axis=1)]
+        distinct = list(dict.fromkeys(primaries))
+        tasks = [(request.solver_type, base_request, primary) for primary in distinct]
+        results = map_solves(_solve_with_objective, tasks[:1])
+        first = results[0]
+        hint = first[0] if not isinstance(first, Exception) and first[1] in ("optimal", "feasible") else None
+        results += map_solves(_solve_with_objective, [task + (hint,) for task in tasks[1:]])
+        by_primary = dict(zip(distinct, results))
+        total_solves = sum(1 for r in results if not isinstance(r, Exception))
+
+        # Extreme: (almost) all weight on one objective; balanced: equal weights
+        is_extreme = (weights >= 0.99).any(axis=1).tolist()
+        is_balanced = (np.abs(weights - 1 / len(obj_names)) < 0.05).all(axis=1).tolist()
 
-            try:
-                resp, status = _solve_with_objective(
-                    request.solver_type, request.solver_request,
-                    primary, request.max_solve_time_seconds,
-                )
-                total_solves += 1
-            except Exception as e:
+        all_points = []
+        for idx, (row, primary) in enumerate(zip(weights.tolist(), primaries)):
+            w = dict(zip(obj_names, row))
+            result = by_primary[primary]
+            if isinstance(result, Exception):
                 all_points.append(ParetoPoint(
                     point_id=idx,
                     objectives={o.name: 0 for o in request.objectives},
@@ -306,14 +335,10 @@ def optimize_pareto(request: ParetoRequest) -> ParetoResponse:
                     status="error",
                 ))
                 continue
+            resp, status = result
 
             feasible = status in ("optimal", "feasible")
-            obj_values = _extract_objectives(request.solver_type, request.objectives, resp) if feasible else {o.name: 0 for o in request.objectives}
-
-            # Determine if extreme or balanced
-            is_extreme = any(v >= 0.99 for v in w.values())
-            total_w = sum(request.objectives[0].weight for _ in request.objectives)  # dummy
-            is_balanced = all(abs(v - 1/len(request.objectives)) < 0.05 for v in w.values())
+            obj_values = _extract_objectives(extractors, resp) if feasible else {o.name: 0 for o in request.objectives}
 
             all_points.append(ParetoPoint(
                 point_id=idx,
@@ -321,8 +346,8 @@ def optimize_pareto(request: ParetoRequest) -> ParetoResponse:
                 weights_used=w,
                 feasible=feasible,
                 status=status,
-                is_extreme=is_extreme,
-                is_balanced=is_balanced,
+                is_extreme=is_extreme[idx],
+                is_balanced=is_balanced[idx],
             ))
 
         feasible_points = [p for p in all_points if p.feasible]
@@ -334,17 +359,18 @@ def optimize_pareto(request: ParetoRequest) -> ParetoResponse:
                 frontier=all_points,
             )
 
-        # Filter to Pareto frontier
-        frontier = _filter_pareto_frontier(feasible_points, request.objectives)
+        # One (points, objectives) matrix serves the frontier filter, the trade-off
+        # statistics and the spread; signs flip maximize_* columns to lower-is-better.
+        values = _objective_matrix(feasible_points, obj_names)
+        on_front = _frontier_mask(values * _objective_signs(request.objectives))
+        frontier = [p for p, keep in zip(feasible_points, on_front) if keep]
+        frontier_values = values[on_front]
 
         # Analyze trade-offs
-        trade_offs = _analyze_trade_offs(frontier, request.objectives)
+        trade_offs = _analyze_trade_offs(frontier_values, obj_names)
 
         # Compute spread
-        spread = {}
-        for obj in request.objectives:
-            vals = [p.objectives.get(obj.name, 0) for p in frontier]
-            spread[obj.name] = round(max(vals) - min(vals), 2) if vals else 0
+        spread = {name: round(float(r), 2) for name, r in zip(obj_names, np.ptp(frontier_values, axis=0))}
 
         metrics = ParetoMetrics(
             points_generated=len(all_points),
@@ -373,7 +399,6 @@ def optimize_pareto(request: ParetoRequest) -> ParetoResponse:
 
         recommendation = " ".join(rec_parts) if rec_parts else "Pareto frontier generated. Review the trade-off points to choose the best compromise."
 
-        obj_names = [o.name for o in request.objectives]
         msg = (
             f"Pareto analysis completed in {metrics.solve_time_seconds:.1f}s. "
             f"{metrics.points_on_frontier} non-dominated solutions found from {total_solves} solves. "
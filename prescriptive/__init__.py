@@ -1,3 +1,5 @@
 """OptimEngine Prescriptive — Forecast + Optimize + Advise."""
 from .models import *  # noqa: F401,F403
-from .engine import prescriptive_advise  # noqa: F401
+from solver.lazy import lazy_engine
+
+__getattr__ = lazy_engine(__name__, {"prescriptive_advise": "engine"})
@@ -5,7 +5,7 @@ Forecast + Optimize + Risk-Aware Recommendations.
 Pipeline:
 1. Forecast each uncertain parameter from historical data
 2. Inject forecasted values into solver request
-3. Solve with point forecast (moderate), upper bound (conservative), lower bound (aggressive)
+3. Solve with point forecast (moderate), upper bound (conservative), lower bound (aggressive) in parallel
 4. Run sensitivity on forecasted parameters
 5. Generate actionable recommendations
 """
@@ -13,7 +13,13 @@ Pipeline:
 import copy
 import math
 import time
-from typing import Any
+from functools import lru_cache
+from importlib import import_module
+from operator import attrgetter
+from statistics import NormalDist
+from typing import Any, Callable
+
+import numpy as np
 
 from .models import (
     PrescriptiveRequest, PrescriptiveResponse, PrescriptiveSolverType,
@@ -22,104 +28,112 @@ from .models import (
 )
 
 from solver.models import ScheduleRequest
-from solver.engine import solve_schedule
 from routing.models import RoutingRequest
-from routing.engine import solve_routing
 from packing.models import PackingRequest
-from packing.engine import solve_packing
+from solver.parallel import map_solves
 
 
 # ─── Path helpers ───
 
-def _resolve_path(data: dict, path: str) -> Any:
-    parts = path.split(".")
-    current = data
-    for part in parts:
+ID_FIELDS = ("job_id", "task_id", "machine_id", "location_id", "vehicle_id", "item_id", "bin_id")
+
+
+def _compile_path(path: str) -> list[tuple[str, str | None]]:
+    """Parse 'jobs[J1].tasks[cut].duration' once into (field, id) steps; id is None for plain keys."""
+    steps = []
+    for part in path.split("."):
         if "[" in part and "]" in part:
-            field = part[:part.index("[")]
-            key = part[part.index("[") + 1:part.index("]")]
-            current = current[field]
-            if isinstance(current, list):
-                found = False
-                for item in current:
-                    for id_field in ["job_id", "task_id", "machine_id",
-                                     "location_id", "vehicle_id",
-                                     "item_id", "bin_id"]:
-                        if isinstance(item, dict) and item.get(id_field) == key:
-                            current = item
-                            found = True
-                            break
-                    if found:
-                        break
-                if not found:
-                    raise KeyError(f"ID '{key}' not found in '{field}'")
+            steps.append((part[:part.index("[")], part[part.index("[") + 1:part.index("]")]))
         else:
-            current = current[part]
+            steps.append((part, None))
+    return steps
+
+
+def _id_position(items: list, key: str, field: str, indexes: dict) -> int:
+    """
+    Position of the first item of `items` carrying `key` in any ID field. Each list is
+    indexed once ({id value: position}) into the `indexes` cache, so later lookups are O(1).
+    """
+    # Keyed by id(); holding the list in the entry keeps that id from being reused
+    cached = indexes.get(id(items))
+    if cached is None:
+        positions = {}
+        for pos, item in enumerate(items):
+            if isinstance(item, dict):
+                for id_field in ID_FIELDS:
+                    if id_field in item:
+                        positions.setdefault(item[id_field], pos)
+        cached = indexes[id(items)] = (items, positions)
+    if key not in cached[1]:
+        raise KeyError(f"ID '{key}' not found in '{field}'")
+    return cached[1][key]
+
+
+def _resolve_path(data: dict, steps: list[tuple[str, str | None]], indexes: dict) -> Any:
+    current = data
+    for field, key in steps:
+        current = current[field]
+        if key is not None and isinstance(current, list):
+            current = current[_id_position(current, key, field, indexes)]
     return current
 
 
-def _set_path(data: dict, path: str, value: Any):
-    parts = path.split(".")
-    current = data
-    for part in parts[:-1]:
-        if "[" in part and "]" in part:
-            field = part[:part.index("[")]
-            key = part[part.index("[") + 1:part.index("]")]
-            current = current[field]
-            if isinstance(current, list):
-                for item in current:
-                    for id_field in ["job_id", "task_id", "machine_id",
-                                     "location_id", "vehicle_id",
-                                     "item_id", "bin_id"]:
-                        if isinstance(item, dict) and item.get(id_field) == key:
-                            current = item
-                            break
+def _cow_set(data: dict, steps: list[tuple[str, str | None]], value: Any, indexes: dict) -> dict:
+    """
+    Copy-on-write set: return a copy of `data` with the path set to `value`. Only the
+    containers along the path are copied; every other subtree is shared with `data`.
+    """
+    root = current = copy.copy(data)
+    for field, key in steps[:-1]:
+        child = current[field]
+        if key is not None and isinstance(child, list):
+            pos = _id_position(child, key, field, indexes)
+            items = current[field] = list(child)
+            # Same order as the original, so the copy reuses its position index
+            indexes[id(items)] = (items, indexes[id(child)][1])
+            current = items[pos] = copy.copy(items[pos])
         else:
-            current = current[part]
-    current[parts[-1]] = value
+            current = current[field] = copy.copy(child)
+    current[steps[-1][0]] = value
+    return root
 
 
 # ─── Forecasting methods ───
 
-def _moving_average(values: list[float], horizon: int = 1) -> float:
+def _moving_average(values: np.ndarray, horizon: int = 1) -> float:
     """Simple moving average of last N values."""
-    window = min(len(values), 5)
-    return sum(values[-window:]) / window
+    return float(values[-5:].mean())
+
 
+# Alpha grid for SES auto-tuning: 0.05, 0.10, ..., 0.95
+SES_ALPHAS = tuple(i / 20 for i in range(1, 20))
 
-def _exponential_smoothing(values: list[float], alpha: float = None, horizon: int = 1) -> float:
-    """Single exponential smoothing (SES)."""
+
+def _ses_pass(history: list[float], alpha: float) -> tuple[float, float]:
+    """One SES pass: (one-step-ahead SSE, final level)."""
+    keep = 1 - alpha
+    sse, s = 0.0, history[0]
+    for v in history[1:]:
+        e = v - s
+        sse += e * e
+        s = alpha * v + keep * s
+    return sse, s
+
+
+def _ses_fit(values: np.ndarray, alpha: float = None) -> tuple[float, float, float]:
+    """
+    Single exponential smoothing (SES): (alpha, final level, RMS of the one-step-ahead
+    residuals). With alpha=None, alpha minimizes the residual SSE over SES_ALPHAS
+    (first on ties); each grid pass yields its level and SSE, so nothing is re-run.
+    """
+    history = values.tolist()
     if alpha is None:
-        # Auto-detect: minimize SSE over grid search
-        best_alpha = 0.3
-        best_sse = float("inf")
-        for a in [i / 20 for i in range(1, 20)]:
-            sse = 0
-            s = values[0]
-            for v in values[1:]:
-                sse += (v - s) ** 2
-                s = a * v + (1 - a) * s
-            if sse < best_sse:
-                best_sse = sse
-                best_alpha = a
-        alpha = best_alpha
-
-    s = values[0]
-    for v in values[1:]:
-        s = alpha * v + (1 - alpha) * s
-    return s
-
-
-def _linear_trend(values: list[float], horizon: int = 1) -> float:
-    """Linear regression trend extrapolation."""
-    n = len(values)
-    x_mean = (n - 1) / 2
-    y_mean = sum(values) / n
-    num = sum((i - x_mean) * (values[i] - y_mean) for i in range(n))
-    den = sum((i - x_mean) ** 2 for i in range(n))
-    slope = num / den if den > 0 else 0
-    intercept = y_mean - slope * x_mean
-    return intercept + slope * (n - 1 + horizon)
+        alpha, (sse, level) = min(
+            ((a, _ses_pass(history, a)) for a in SES_ALPHAS), key=lambda fit: fit[1][0],
+        )
+    else:
+        sse, level = _ses_pass(history, alpha)
+    return alpha, level, math.sqrt(sse / (len(history) - 1))
 
 
 def _seasonal_naive(values: list[float], period: int, horizon: int = 1) -> float:
@@ -127,69 +141,90 @@ def _seasonal_naive(values: list[float], period: int, horizon: int = 1) -> float
     if period and period <= len(values):
         idx = len(values) - period + ((horizon - 1) % period)
         if 0 <= idx < len(values):
-            return values[idx]
-    return values[-1]
+            return float(values[idx])
+    return float(values[-1])
+
+
+# Two-sided z-scores for the customary confidence levels (as published, rounded)
+Z_SCORES = {0.50: 0.674, 0.80: 1.282, 0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
+_STANDARD_NORMAL = NormalDist()
+
+
+@lru_cache(maxsize=64)
+def _z_score(confidence_level: float) -> float:
+    """Two-sided z-score: tabulated levels keep their published value, others are exact."""
+    z = Z_SCORES.get(confidence_level)
+    if z is None:
+        z = _STANDARD_NORMAL.inv_cdf((1 + confidence_level) / 2)
+    return z
+
+# Prediction-interval widening per forecast horizon (ForecastParameter allows 1-12)
+HORIZON_WIDENING = {h: math.sqrt(1 + h * 0.1) for h in range(1, 13)}
 
 
 def _forecast_parameter(param: ForecastParameter) -> ForecastResult:
     """Run forecast for a single parameter."""
-    # Sort by period, extract values
-    sorted_data = sorted(param.historical_data, key=lambda p: p.period)
-    values = [p.value for p in sorted_data]
+    # Sort by period, extract values (Timsort is a single linear pass on already-sorted data)
+    sorted_data = sorted(param.historical_data, key=attrgetter("period"))
+    fields = _forecast_core(
+        tuple(p.value for p in sorted_data), param.forecast_method, param.forecast_horizon,
+        param.smoothing_alpha, param.seasonal_period, param.confidence_level,
+    )
+    return ForecastResult(parameter_path=param.parameter_path, **fields)
+
+
+@lru_cache(maxsize=1024)
+def _forecast_core(
+    history: tuple[float, ...],
+    method: ForecastMethod,
+    horizon: int,
+    smoothing_alpha: float | None,
+    seasonal_period: int | None,
+    confidence_level: float,
+) -> dict[str, Any]:
+    """
+    ForecastResult fields (all but parameter_path) for a sorted history. Pure in its
+    arguments, so repeated requests over the same data are answered from the cache;
+    callers must not mutate the returned dict.
+    """
+    values = np.array(history, dtype=np.float64)
     n = len(values)
 
-    mean_val = sum(values) / n
-    variance = sum((v - mean_val) ** 2 for v in values) / n
-    std_val = math.sqrt(variance) if variance > 0 else 0
+    mean_val = float(values.mean())
+    deviations = values - mean_val
+    std_val = float(np.sqrt(deviations @ deviations / n))
 
-    # Forecast
-    method = param.forecast_method
-    horizon = param.forecast_horizon
+    # Least-squares slope over the centred period index: the linear-trend forecast
+    # and the trend classification both use it
+    x = np.arange(n) - (n - 1) / 2
+    slope = float(x @ deviations / (x @ x))
+
+    # Prediction interval: residual-based. Outside SES the residuals are taken from
+    # the mean, and their RMS is the historical std.
+    res_std = std_val
 
+    # Forecast
     if method == ForecastMethod.MOVING_AVERAGE:
         forecast = _moving_average(values, horizon)
     elif method == ForecastMethod.EXPONENTIAL_SMOOTHING:
-        forecast = _exponential_smoothing(values, param.smoothing_alpha, horizon)
+        # One fit gives both the level and the residuals of the fitted alpha
+        _, forecast, res_std = _ses_fit(values, smoothing_alpha)
     elif method == ForecastMethod.LINEAR_TREND:
-        forecast = _linear_trend(values, horizon)
+        # Intercept at the centre of the history, extrapolated to n - 1 + horizon
+        forecast = mean_val + slope * ((n - 1) / 2 + horizon)
     elif method == ForecastMethod.SEASONAL_NAIVE:
-        forecast = _seasonal_naive(values, param.seasonal_period or 4, horizon)
-    else:
-        forecast = values[-1]
-
-    # Prediction interval
-    # Use residual-based interval
-    if method == ForecastMethod.EXPONENTIAL_SMOOTHING:
-        alpha = param.smoothing_alpha or 0.3
-        s = values[0]
-        residuals = []
-        for v in values[1:]:
-            residuals.append(v - s)
-            s = alpha * v + (1 - alpha) * s
+        forecast = _seasonal_naive(values, seasonal_period or 4, horizon)
     else:
-        # Simple residual from mean
-        residuals = [v - mean_val for v in values]
+        forecast = float(values[-1])
 
-    if residuals:
-        res_std = math.sqrt(sum(r ** 2 for r in residuals) / len(residuals))
-    else:
-        res_std = std_val
-
-    # Z-score for confidence
-    z_map = {0.50: 0.674, 0.80: 1.282, 0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
-    z = z_map.get(param.confidence_level, 1.96)
-    margin = z * res_std * math.sqrt(1 + horizon * 0.1)  # widen with horizon
+    # Z-score for confidence, interval widened with horizon
+    margin = _z_score(confidence_level) * res_std * HORIZON_WIDENING[horizon]
 
     lower = forecast - margin
     upper = forecast + margin
 
     # Trend analysis
     if n >= 3:
-        x_mean = (n - 1) / 2
-        y_mean = mean_val
-        num = sum((i - x_mean) * (values[i] - y_mean) for i in range(n))
-        den = sum((i - x_mean) ** 2 for i in range(n))
-        slope = num / den if den > 0 else 0
         normalized_slope = abs(slope) / mean_val if mean_val > 0 else 0
 
         if normalized_slope < 0.02:
@@ -208,15 +243,14 @@ def _forecast_parameter(param: ForecastParameter) -> ForecastResult:
         trend = "stable"
         normalized_slope = 0
 
-    return ForecastResult(
-        parameter_path=param.parameter_path,
+    return dict(
         method_used=method.value,
         historical_mean=round(mean_val, 2),
         historical_std=round(std_val, 2),
         forecast_value=round(forecast, 2),
         lower_bound=round(max(0, lower), 2),
         upper_bound=round(upper, 2),
-        confidence_level=param.confidence_level,
+        confidence_level=confidence_level,
         trend=trend,
         trend_strength=round(normalized_slope, 4),
         forecast_horizon=horizon,
@@ -225,26 +259,33 @@ def _forecast_parameter(param: ForecastParameter) -> ForecastResult:
 
 # ─── Solver dispatch ───
 
+# Solver type → (request model, engine module, solve function, objective metric).
+# Engines (and OR-Tools with them) are imported on first use of each solver type.
+_SOLVER_SPECS = {
+    PrescriptiveSolverType.SCHEDULING: (ScheduleRequest, "solver.engine", "solve_schedule", "makespan"),
+    PrescriptiveSolverType.ROUTING: (RoutingRequest, "routing.engine", "solve_routing", "total_distance"),
+    PrescriptiveSolverType.PACKING: (PackingRequest, "packing.engine", "solve_packing", "bins_used"),
+}
+
+
+@lru_cache(maxsize=None)
+def _get_solver(solver_type: PrescriptiveSolverType) -> tuple[type, Callable, str]:
+    if solver_type not in _SOLVER_SPECS:
+        raise ValueError(f"Unknown solver: {solver_type}")
+    request_cls, module, fn_name, metric = _SOLVER_SPECS[solver_type]
+    return request_cls, getattr(import_module(module), fn_name), metric
+
+
 def _solve(solver_type: PrescriptiveSolverType, request_data: dict, max_time: int):
-    data = copy.deepcopy(request_data)
-    data["max_solve_time_seconds"] = max_time
-
-    if solver_type == PrescriptiveSolverType.SCHEDULING:
-        req = ScheduleRequest(**data)
-        resp = solve_schedule(req)
-        obj = resp.metrics.makespan if resp.metrics else 0
-        return resp.status.value, float(obj), "makespan"
-    elif solver_type == PrescriptiveSolverType.ROUTING:
-        req = RoutingRequest(**data)
-        resp = solve_routing(req)
-        obj = resp.metrics.total_distance if resp.metrics else 0
-        return resp.status.value, float(obj), "total_distance"
-    elif solver_type == PrescriptiveSolverType.PACKING:
-        req = PackingRequest(**data)
-        resp = solve_packing(req)
-        obj = resp.metrics.bins_used if resp.metrics else 0
-        return resp.status.value, float(obj), "bins_used"
-    raise ValueError(f"Unknown solver: {solver_type}")
+    """Dispatch to the appropriate solver.
+
+    request_data may share subtrees with other scenarios (see _cow_set);
+    this function does not mutate its input.
+    """
+    request_cls, solve_fn, metric = _get_solver(solver_type)
+    resp = solve_fn(request_cls(**{**request_data, "max_solve_time_seconds": max_time}))
+    obj = getattr(resp.metrics, metric) if resp.metrics else 0
+    return resp.status.value, float(obj), metric
 
 
 # ─── Main engine ───
@@ -257,25 +298,37 @@ def prescriptive_advise(request: PrescriptiveRequest) -> PrescriptiveResponse:
         data = request.solver_request
 
         # ── Step 1: Forecast ──
+        # Each parameter path is parsed once and its current value read once; the
+        # scenarios below reuse both.
         forecasts = []
+        plans = []
+        originals = []
+        indexes = {}  # ID lookups per list object, shared by every path below
         for fp in request.forecast_parameters:
+            plan = _compile_path(fp.parameter_path)
             try:
-                _resolve_path(data, fp.parameter_path)
+                originals.append(_resolve_path(data, plan, indexes))
             except (KeyError, ValueError) as e:
                 return PrescriptiveResponse(
                     status="error",
                     message=f"Cannot resolve parameter '{fp.parameter_path}': {e}",
                 )
+            plans.append(plan)
             fc = _forecast_parameter(fp)
             forecasts.append(fc)
 
         # ── Step 2: Inject and Optimize ──
         # Prepare three scenarios: conservative, moderate, aggressive
-        scenarios = {}
+        labels = []
+        scenario_params = []
+        scenario_task = []
+        tasks = []
+        task_of = {}
         for label, appetite in [("conservative", "upper"), ("moderate", "point"), ("aggressive", "lower")]:
-            scenario_data = copy.deepcopy(data)
+            # Scenarios share the base request; only the paths they change are copied
+            scenario_data = data
             params_used = {}
-            for fc in forecasts:
+            for fc, plan, orig in zip(forecasts, plans, originals):
                 if appetite == "upper":
                     val = fc.upper_bound
                 elif appetite == "lower":
@@ -283,20 +336,32 @@ def prescriptive_advise(request: PrescriptiveRequest) -> PrescriptiveResponse:
                 else:
                     val = fc.forecast_value
 
-                orig = _resolve_path(data, fc.parameter_path)
                 if isinstance(orig, int):
                     val = max(0, int(round(val)))
                 else:
                     val = max(0.0, round(val, 2))
-                _set_path(scenario_data, fc.parameter_path, val)
+                scenario_data = _cow_set(scenario_data, plan, val, indexes)
                 params_used[fc.parameter_path] = val
 
-            try:
-                status, obj, obj_name = _solve(
-                    request.solver_type, scenario_data, request.max_solve_time_seconds,
-                )
-            except Exception as e:
+            labels.append(label)
+            scenario_params.append(params_used)
+            # Low-variance forecasts round to the same values across scenarios: identical
+            # parameter sets share one solve
+            signature = tuple(params_used.values())
+            if signature not in task_of:
+                task_of[signature] = len(tasks)
+                tasks.append((request.solver_type, scenario_data, request.max_solve_time_seconds))
+            scenario_task.append(task_of[signature])
+
+        # The distinct solves are independent: run them as one parallel batch
+        outcomes = map_solves(_solve, tasks)
+        scenarios = {}
+        for label, params_used, t in zip(labels, scenario_params, scenario_task):
+            outcome = outcomes[t]
+            if isinstance(outcome, Exception):
                 status, obj, obj_name = "error", 0, "unknown"
+            else:
+                status, obj, obj_name = outcome
 
             scenarios[label] = {
                 "status": status,
@@ -325,9 +390,12 @@ def prescriptive_advise(request: PrescriptiveRequest) -> PrescriptiveResponse:
         else:
             feas_risk = "high"
 
-        # Find most sensitive forecasted parameter
+        # One pass over the forecasts: the most sensitive parameter (risk), the
+        # trend-based actions and the trend lines of the recommendation
         max_impact = 0
         critical_param = ""
+        trend_actions = []
+        trend_notes = []
         for fc in forecasts:
             spread = fc.upper_bound - fc.lower_bound
             if fc.historical_mean > 0:
@@ -338,46 +406,45 @@ def prescriptive_advise(request: PrescriptiveRequest) -> PrescriptiveResponse:
                 max_impact = rel_spread
                 critical_param = fc.parameter_path
 
-        sensitivity_summary = f"Most critical: {critical_param} (prediction spread: {max_impact:.0%} of mean)." if critical_param else ""
-
-        risk = RiskAssessment(
-            conservative_objective=scenarios["conservative"]["objective"],
-            moderate_objective=scenarios["moderate"]["objective"],
-            aggressive_objective=scenarios["aggressive"]["objective"],
-            sensitivity_summary=sensitivity_summary,
-            feasibility_risk=feas_risk,
-        )
-
-        # ── Step 4: Generate Actions ──
-        actions = []
-        priority = 1
-
-        # Trend-based actions
-        for fc in forecasts:
+            if fc.trend == "stable":
+                continue
+            trend_notes.append(f"{fc.parameter_path} is {fc.trend} (forecast: {fc.forecast_value}).")
             if fc.trend == "increasing":
-                actions.append(Action(
-                    priority=priority,
+                trend_actions.append(Action(
+                    priority=len(trend_actions) + 1,
                     action=f"Plan for increasing {fc.parameter_path} (trend: +{fc.trend_strength:.1%}/period).",
                     reason=f"Historical data shows consistent upward trend. Forecast: {fc.forecast_value} (was {fc.historical_mean} avg).",
                     impact=f"May need {((fc.forecast_value - fc.historical_mean) / fc.historical_mean * 100):.0f}% more capacity." if fc.historical_mean > 0 else "",
                 ))
-                priority += 1
             elif fc.trend == "volatile":
-                actions.append(Action(
-                    priority=priority,
+                trend_actions.append(Action(
+                    priority=len(trend_actions) + 1,
                     action=f"Add safety buffer for {fc.parameter_path} (volatile: CV={fc.trend_strength:.0%}).",
                     reason=f"High variability in historical data. Prediction interval: [{fc.lower_bound}, {fc.upper_bound}].",
                     impact="Consider robust or conservative planning.",
                 ))
-                priority += 1
             elif fc.trend == "decreasing":
-                actions.append(Action(
-                    priority=priority,
+                trend_actions.append(Action(
+                    priority=len(trend_actions) + 1,
                     action=f"Monitor declining {fc.parameter_path} (trend: -{fc.trend_strength:.1%}/period).",
                     reason=f"Downward trend detected. Forecast: {fc.forecast_value} (was {fc.historical_mean} avg).",
                     impact="Potential to reduce allocated resources.",
                 ))
-                priority += 1
+
+        sensitivity_summary = f"Most critical: {critical_param} (prediction spread: {max_impact:.0%} of mean)." if critical_param else ""
+
+        risk = RiskAssessment(
+            conservative_objective=scenarios["conservative"]["objective"],
+            moderate_objective=scenarios["moderate"]["objective"],
+            aggressive_objective=scenarios["aggressive"]["objective"],
+            sensitivity_summary=sensitivity_summary,
+            feasibility_risk=feas_risk,
+        )
+
+        # ── Step 4: Generate Actions ──
+        # Trend-based actions come first (built in the forecast pass above)
+        actions = trend_actions
+        priority = len(actions) + 1
 
         # Feasibility-based actions
         if feas_risk == "high":
@@ -410,21 +477,23 @@ def prescriptive_advise(request: PrescriptiveRequest) -> PrescriptiveResponse:
 
         # ── Step 5: Executive Recommendation ──
         obj_name = primary["obj_name"]
+        p_obj = primary["objective"]
         mod_obj = scenarios["moderate"]["objective"]
         con_obj = scenarios["conservative"]["objective"]
         agg_obj = scenarios["aggressive"]["objective"]
+        n_fc = len(forecasts)
+        appetite = request.risk_appetite.value
 
-        rec_parts = []
-        rec_parts.append(f"Based on {len(forecasts)} forecasted parameter(s) using {request.risk_appetite.value} risk appetite:")
-        rec_parts.append(f"Recommended {obj_name}: {primary['objective']}.")
+        rec_parts = [
+            f"Based on {n_fc} forecasted parameter(s) using {appetite} risk appetite:",
+            f"Recommended {obj_name}: {p_obj}.",
+        ]
 
         if con_obj > 0 and agg_obj > 0 and con_obj != agg_obj:
             spread_pct = abs(con_obj - agg_obj) / mod_obj * 100 if mod_obj > 0 else 0
             rec_parts.append(f"Outcome range: {agg_obj} (optimistic) to {con_obj} (pessimistic), spread {spread_pct:.0f}%.")
 
-        for fc in forecasts:
-            if fc.trend != "stable":
-                rec_parts.append(f"{fc.parameter_path} is {fc.trend} (forecast: {fc.forecast_value}).")
+        rec_parts += trend_notes
 
         if feas_risk != "low":
             rec_parts.append(f"Feasibility risk: {feas_risk}. Monitor closely.")
@@ -433,9 +502,9 @@ def prescriptive_advise(request: PrescriptiveRequest) -> PrescriptiveResponse:
 
         msg = (
             f"Prescriptive analysis completed in {time.time() - t0:.1f}s. "
-            f"{len(forecasts)} parameter(s) forecasted. "
-            f"Risk appetite: {request.risk_appetite.value}. "
-            f"Recommended {obj_name}: {primary['objective']}. "
+            f"{n_fc} parameter(s) forecasted. "
+            f"Risk appetite: {appetite}. "
+            f"Recommended {obj_name}: {p_obj}. "
             f"Feasibility risk: {feas_risk}."
         )
 
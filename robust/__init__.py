@@ -1,3 +1,5 @@
 """OptimEngine Robust — Worst-case Optimization under Uncertainty."""
 from .models import *  # noqa: F401,F403
-from .engine import optimize_robust  # noqa: F401
+from solver.lazy import lazy_engine
+
+__getattr__ = lazy_engine(__name__, {"optimize_robust": "engine"})
@@ -27,6 +27,7 @@ from routing.models import RoutingRequest
 from routing.engine import solve_routing
 from packing.models import PackingRequest
 from packing.engine import solve_packing
+from solver.parallel import map_solves
 
 
 # ─── Path resolution (shared logic with sensitivity) ───
@@ -136,30 +137,39 @@ def _generate_scenarios(
 
 # ─── Solver dispatch ───
 
-def _solve(solver_type: RobustSolverType, request_data: dict, max_time: int) -> tuple[str, float, str]:
-    """Solve and return (status, objective_value, objective_name)."""
+def _solve_response(solver_type: RobustSolverType, request_data: dict, max_time: int, hint=None):
+    """
+    Solve and return the solver's own response.
+    hint: a previous response for the same problem, used to warm-start the solver.
+    """
     request_data = copy.deepcopy(request_data)
     request_data["max_solve_time_seconds"] = max_time
 
     if solver_type == RobustSolverType.SCHEDULING:
-        req = ScheduleRequest(**request_data)
-        resp = solve_schedule(req)
+        return solve_schedule(ScheduleRequest(**request_data), hint=hint)
+    elif solver_type == RobustSolverType.ROUTING:
+        return solve_routing(RoutingRequest(**request_data), hint=hint)
+    elif solver_type == RobustSolverType.PACKING:
+        return solve_packing(PackingRequest(**request_data), hint=hint)
+
+    raise ValueError(f"Unknown solver type: {solver_type}")
+
+
+def _summarize(solver_type: RobustSolverType, resp) -> tuple[str, float, str]:
+    """Return (status, objective_value, objective_name) for a solver response."""
+    if solver_type == RobustSolverType.SCHEDULING:
         obj = resp.metrics.makespan if resp.metrics else 0
         return resp.status.value, float(obj), "makespan"
-
     elif solver_type == RobustSolverType.ROUTING:
-        req = RoutingRequest(**request_data)
-        resp = solve_routing(req)
         obj = resp.metrics.total_distance if resp.metrics else 0
         return resp.status.value, float(obj), "total_distance"
+    obj = resp.metrics.bins_used if resp.metrics else 0
+    return resp.status.value, float(obj), "bins_used"
 
-    elif solver_type == RobustSolverType.PACKING:
-        req = PackingRequest(**request_data)
-        resp = solve_packing(req)
-        obj = resp.metrics.bins_used if resp.metrics else 0
-        return resp.status.value, float(obj), "bins_used"
 
-    raise ValueError(f"Unknown solver type: {solver_type}")
+def _solve(solver_type: RobustSolverType, request_data: dict, max_time: int, hint=None) -> tuple[str, float, str]:
+    """Solve and return (status, objective_value, objective_name)."""
+    return _summarize(solver_type, _solve_response(solver_type, request_data, max_time, hint))
 
 
 # ─── Main engine ───
@@ -194,11 +204,9 @@ def optimize_robust(request: RobustRequest) -> RobustResponse:
             request.num_scenarios,
         )
 
-        # 3. Solve each scenario
-        results = []
-        feasible_objectives = []
-
-        for i, scenario in enumerate(scenarios):
+        # 3. Solve each scenario (independent solves, run as one parallel batch)
+        scenario_tasks = []
+        for scenario in scenarios:
             scenario_data = copy.deepcopy(data)
             for path, val in scenario.items():
                 try:
@@ -209,13 +217,25 @@ def optimize_robust(request: RobustRequest) -> RobustResponse:
                     _set_path(scenario_data, path, val)
                 except Exception:
                     continue
+            scenario_tasks.append((request.solver_type, scenario_data, request.max_solve_time_seconds))
+
+        # The nominal scenario is solved first; its solution warm-starts the rest.
+        hint = None
+        try:
+            nominal_resp = _solve_response(*scenario_tasks[0])
+            outcomes = [_summarize(request.solver_type, nominal_resp)]
+            if outcomes[0][0] in ("optimal", "feasible"):
+                hint = nominal_resp
+        except Exception as e:
+            outcomes = [e]
+        outcomes += map_solves(_solve, [task + (hint,) for task in scenario_tasks[1:]])
 
-            try:
-                status, obj, obj_name = _solve(
-                    request.solver_type, scenario_data, request.max_solve_time_seconds,
-                )
-                total_solves += 1
-            except Exception as e:
+        results = []
+        feasible_objectives = []
+        obj_name = "objective"
+
+        for i, (scenario, outcome) in enumerate(zip(scenarios, outcomes)):
+            if isinstance(outcome, Exception):
                 results.append(ScenarioResult(
                     scenario_id=i,
                     parameter_values=scenario,
@@ -225,6 +245,8 @@ def optimize_robust(request: RobustRequest) -> RobustResponse:
                     is_nominal=(i == 0),
                 ))
                 continue
+            status, obj, obj_name = outcome
+            total_solves += 1
 
             feasible = status in ("optimal", "feasible")
             if feasible:
@@ -246,14 +268,6 @@ def optimize_robust(request: RobustRequest) -> RobustResponse:
                 scenarios=results,
             )
 
-        obj_name = "objective"
-        if results:
-            # Get obj_name from a successful solve
-            try:
-                _, _, obj_name = _solve(request.solver_type, data, request.max_solve_time_seconds)
-            except Exception:
-                pass
-
         # 4. Analyze results
         nominal_obj = results[0].objective_value if results[0].feasible else None
         sorted_feasible = sorted(feasible_objectives)
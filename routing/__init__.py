@@ -1,3 +1,5 @@
 """OptimEngine Routing — CVRPTW via OR-Tools."""
 from .models import *  # noqa: F401,F403
-from .engine import solve_routing  # noqa: F401
+from solver.lazy import lazy_engine
+
+__getattr__ = lazy_engine(__name__, {"solve_routing": "engine"})
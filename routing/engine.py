@@ -1,8 +1,15 @@
 """
 OptimEngine — CVRPTW Routing Solver
 Capacitated Vehicle Routing Problem with Time Windows via Google OR-Tools.
+
+Design:
+- Distance/time callbacks are Python closures. Models up to ROUTING_CALLBACK_CACHE nodes
+  (default 1000, the request limit; 0 disables) have OR-Tools cache every callback value
+  up front, so local search reads a C++ table instead of crossing into Python per arc.
+  The cache is O(nodes^2) per callback (~8 MB at 1000 nodes).
 """
 import math
+import os
 import time
 from typing import Optional
 from ortools.constraint_solver import routing_enums_pb2, pywrapcp
@@ -16,6 +23,8 @@ from .models import (
 
 tracer = get_tracer(__name__)
 
+ROUTING_CALLBACK_CACHE = int(os.environ.get("ROUTING_CALLBACK_CACHE", 1000))
+
 
 def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> int:
     R = 6371000
@@ -75,7 +84,31 @@ def _build_distance_matrix(request: RoutingRequest) -> tuple[list[list[int]], li
     return dist, travel_time
 
 
-def solve_routing(request: RoutingRequest) -> RoutingResponse:
+def _hint_assignment(routing, manager, request: RoutingRequest, hint: RoutingResponse,
+                     loc_index: dict, search_params):
+    """
+    Initial assignment built from a previous solution's routes (matched by vehicle_id and
+    location_id), for warm-starting a perturbed re-solve. None if the old routes no longer
+    fit: unknown IDs, or routes that violate the new capacities/time windows.
+    """
+    hinted = {r.vehicle_id: r for r in hint.routes}
+    routes = []
+    for veh in request.vehicles:
+        route = hinted.get(veh.vehicle_id)
+        stops = [loc_index.get(s.location_id) for s in route.stops] if route else []
+        if None in stops:
+            return None
+        routes.append([manager.NodeToIndex(node) for node in stops])
+
+    routing.CloseModelWithParameters(search_params)
+    return routing.ReadAssignmentFromRoutes(routes, True)
+
+
+def solve_routing(request: RoutingRequest, hint: Optional[RoutingResponse] = None) -> RoutingResponse:
+    """
+    Solve a CVRPTW with OR-Tools Routing.
+    hint: optional previous solution whose routes seed the search (see _hint_assignment).
+    """
     t0 = time.time()
     with tracer.start_as_current_span("solve_routing") as root_span:
         root_span.set_attribute("optim.num_locations", len(request.locations))
@@ -102,7 +135,9 @@ def solve_routing(request: RoutingRequest) -> RoutingResponse:
                 build_span.set_attribute("optim.matrix_size", num_locations * num_locations)
 
                 manager = pywrapcp.RoutingIndexManager(num_locations, num_vehicles, depot_idx)
-                routing = pywrapcp.RoutingModel(manager)
+                model_parameters = pywrapcp.DefaultRoutingModelParameters()
+                model_parameters.max_callback_cache_size = min(num_locations, ROUTING_CALLBACK_CACHE)
+                routing = pywrapcp.RoutingModel(manager, model_parameters)
 
                 def distance_callback(from_index, to_index):
                     from_node = manager.IndexToNode(from_index)
@@ -232,7 +267,14 @@ def solve_routing(request: RoutingRequest) -> RoutingResponse:
                 search_params.log_search = False
 
             with tracer.start_as_current_span("cp_sat_solve") as solve_span:
-                solution = routing.SolveWithParameters(search_params)
+                initial = None
+                if hint is not None and hint.routes:
+                    initial = _hint_assignment(routing, manager, request, hint, loc_index, search_params)
+                solve_span.set_attribute("optim.warm_start", initial is not None)
+                if initial is not None:
+                    solution = routing.SolveFromAssignmentWithParameters(initial, search_params)
+                else:
+                    solution = routing.SolveWithParameters(search_params)
                 solve_span.set_attribute("optim.solver_status_code", routing.status())
                 solve_span.set_attribute("optim.solution_found", solution is not None)
 
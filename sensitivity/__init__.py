@@ -1,3 +1,5 @@
 """OptimEngine Sensitivity — Parametric Sensitivity Analysis."""
 from .models import *  # noqa: F401,F403
-from .engine import analyze_sensitivity  # noqa: F401
+from solver.lazy import lazy_engine
+
+__getattr__ = lazy_engine(__name__, {"analyze_sensitivity": "engine"})
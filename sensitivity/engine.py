@@ -22,6 +22,7 @@ from routing.models import RoutingRequest
 from routing.engine import solve_routing
 from packing.models import PackingRequest
 from packing.engine import solve_packing
+from solver.parallel import map_solves
 
 
 # ─── Parameter resolution ───
@@ -179,32 +180,44 @@ def _auto_detect_packing(data: dict) -> list[ParameterSpec]:
 
 # ─── Solver dispatch ───
 
-def _solve(solver_type: SolverType, request_data: dict, max_time: int) -> tuple[str, float, str]:
+def _solve_response(solver_type: SolverType, request_data: dict, max_time: int, hint=None):
     """
-    Solve and return (status, objective_value, objective_name).
+    Solve and return the solver's own response.
+    hint: the baseline response. A hinted call is a perturbed re-solve: same model structure,
+    a few changed numbers, so CP-SAT also skips the expensive presolve stages (probing,
+    repeated passes) that the baseline solve already paid for.
     """
     request_data = copy.deepcopy(request_data)
     request_data["max_solve_time_seconds"] = max_time
+    light_presolve = hint is not None
+
+    if solver_type == SolverType.SCHEDULING:
+        return solve_schedule(ScheduleRequest(**request_data), hint=hint, light_presolve=light_presolve)
+    elif solver_type == SolverType.ROUTING:
+        return solve_routing(RoutingRequest(**request_data), hint=hint)
+    elif solver_type == SolverType.PACKING:
+        return solve_packing(PackingRequest(**request_data), hint=hint, light_presolve=light_presolve)
+
+    raise ValueError(f"Unknown solver type: {solver_type}")
+
 
+def _summarize(solver_type: SolverType, resp) -> tuple[str, float, str]:
+    """Return (status, objective_value, objective_name) for a solver response."""
     if solver_type == SolverType.SCHEDULING:
-        req = ScheduleRequest(**request_data)
-        resp = solve_schedule(req)
         obj = resp.metrics.makespan if resp.metrics else 0
         return resp.status.value, float(obj), "makespan"
-
     elif solver_type == SolverType.ROUTING:
-        req = RoutingRequest(**request_data)
-        resp = solve_routing(req)
         obj = resp.metrics.total_distance if resp.metrics else 0
         return resp.status.value, float(obj), "total_distance"
+    obj = resp.metrics.bins_used if resp.metrics else 0
+    return resp.status.value, float(obj), "bins_used"
 
-    elif solver_type == SolverType.PACKING:
-        req = PackingRequest(**request_data)
-        resp = solve_packing(req)
-        obj = resp.metrics.bins_used if resp.metrics else 0
-        return resp.status.value, float(obj), "bins_used"
 
-    raise ValueError(f"Unknown solver type: {solver_type}")
+def _solve(solver_type: SolverType, request_data: dict, max_time: int, hint=None) -> tuple[str, float, str]:
+    """
+    Solve and return (status, objective_value, objective_name).
+    """
+    return _summarize(solver_type, _solve_response(solver_type, request_data, max_time, hint))
 
 
 # ─── Main engine ───
@@ -219,9 +232,8 @@ def analyze_sensitivity(request: SensitivityRequest) -> SensitivityResponse:
 
         # 1. Solve baseline
         try:
-            base_status, base_obj, obj_name = _solve(
-                request.solver_type, data, request.max_solve_time_seconds
-            )
+            base_resp = _solve_response(request.solver_type, data, request.max_solve_time_seconds)
+            base_status, base_obj, obj_name = _summarize(request.solver_type, base_resp)
             total_solves += 1
         except Exception as e:
             return SensitivityResponse(
@@ -253,9 +265,11 @@ def analyze_sensitivity(request: SensitivityRequest) -> SensitivityResponse:
                 message="No parameters to analyze. Specify parameters or ensure the request has perturbable fields.",
             )
 
-        # 3. Perturb each parameter
-        param_results = []
-
+        # 3. Perturb each parameter. Every perturbed re-solve is independent, so they are
+        #    planned first and solved as one parallel batch, each warm-started from the
+        #    baseline solution.
+        planned = []  # (spec, base_value, display_name, [(pert, new_val)])
+        solve_tasks = []
         for spec in params:
             try:
                 base_value, display_name = _resolve_path(data, spec.parameter_path)
@@ -265,13 +279,8 @@ def analyze_sensitivity(request: SensitivityRequest) -> SensitivityResponse:
             if not isinstance(base_value, (int, float)) or base_value == 0:
                 continue
 
-            perturbations = spec.perturbations[:request.max_perturbations_per_param]
-            p_results = []
-            max_delta = 0.0
-            increases_hurt = 0
-            decreases_hurt = 0
-
-            for pert in perturbations:
+            runs = []
+            for pert in spec.perturbations[:request.max_perturbations_per_param]:
                 new_val = _apply_perturbation(base_value, pert, spec.mode)
                 if new_val == base_value:
                     continue
@@ -282,13 +291,22 @@ def analyze_sensitivity(request: SensitivityRequest) -> SensitivityResponse:
                 except Exception:
                     continue
 
-                try:
-                    p_status, p_obj, _ = _solve(
-                        request.solver_type, perturbed_data,
-                        request.max_solve_time_seconds,
-                    )
-                    total_solves += 1
-                except Exception:
+                runs.append((pert, new_val))
+                solve_tasks.append((request.solver_type, perturbed_data, request.max_solve_time_seconds, base_resp))
+            planned.append((spec, base_value, display_name, runs))
+
+        solved = iter(map_solves(_solve, solve_tasks))
+        param_results = []
+
+        for spec, base_value, display_name, runs in planned:
+            p_results = []
+            max_delta = 0.0
+            increases_hurt = 0
+            decreases_hurt = 0
+
+            for pert, new_val in runs:
+                outcome = next(solved)
+                if isinstance(outcome, Exception):
                     p_results.append(PerturbationResult(
                         perturbation_value=pert,
                         new_param_value=new_val,
@@ -298,6 +316,8 @@ def analyze_sensitivity(request: SensitivityRequest) -> SensitivityResponse:
                         status="error",
                     ))
                     continue
+                p_status, p_obj, _ = outcome
+                total_solves += 1
 
                 feasible = p_status in ("optimal", "feasible")
                 if feasible and base_obj > 0:
@@ -1,4 +1,8 @@
 """OptimEngine Solver — Flexible Job Shop Scheduling via OR-Tools CP-SAT."""
 from .models import *  # noqa: F401,F403
-from .engine import solve_schedule  # noqa: F401
-from .validator import validate_schedule  # noqa: F401
+from .lazy import lazy_engine
+
+__getattr__ = lazy_engine(__name__, {
+    "solve_schedule": "engine",
+    "validate_schedule": "validator",
+})
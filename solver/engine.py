@@ -28,6 +28,7 @@ from .models import (
     JobSummary, MachineUtilization, ScheduleMetrics, GanttEntry,
     SolverStatus, ObjectiveType, SetupTimeEntry,
 )
+from . import parallel
 
 
 # Named tuples for internal bookkeeping
@@ -75,7 +76,39 @@ def _get_setup_time(matrix: dict, machine_id: str, from_job: str, to_job: str) -
     return 0
 
 
-def _solve_schedule_impl(request: ScheduleRequest) -> ScheduleResponse:
+def _add_solution_hints(model, hint: ScheduleResponse, horizon: int, task_starts: dict, task_ends: dict,
+                        all_task_vars: dict, presence_literals: dict) -> None:
+    """
+    Warm-start from a previous schedule of a (slightly perturbed) request: hint each task's
+    machine and start. Tasks whose hinted machine is no longer eligible, or that would no
+    longer end inside the horizon, are left unhinted — out-of-domain hints can stall CP-SAT.
+    """
+    chosen = {}
+    for st in hint.schedule:
+        tv = all_task_vars.get((st.job_id, st.task_id, st.machine_id))
+        if tv is not None and st.start + tv.duration <= horizon:
+            chosen[(st.job_id, st.task_id)] = st
+
+    for (jid, tid, mid), tv in all_task_vars.items():
+        st = chosen.get((jid, tid))
+        if st is None:
+            continue
+        presence = presence_literals.get((jid, tid, mid))
+        if st.machine_id != mid:
+            if presence is not None:
+                model.add_hint(presence, False)
+            continue
+        end = st.start + tv.duration
+        model.add_hint(task_starts[(jid, tid)], st.start)
+        model.add_hint(task_ends[(jid, tid)], end)
+        if presence is not None:
+            model.add_hint(presence, True)
+            model.add_hint(tv.start, st.start)
+            model.add_hint(tv.end, end)
+
+
+def _solve_schedule_impl(request: ScheduleRequest, hint: Optional[ScheduleResponse] = None,
+                         light_presolve: bool = False) -> ScheduleResponse:
     """
     Solve a Flexible Job Shop Scheduling Problem.
     
@@ -84,6 +117,9 @@ def _solve_schedule_impl(request: ScheduleRequest) -> ScheduleResponse:
     2. Adds variables, constraints, and objective
     3. Solves with the given time limit
     4. Extracts and formats the solution
+
+    hint: a previous solution to warm-start from (see _add_solution_hints).
+    light_presolve: single presolve pass without probing, for near-identical re-solves.
     """
     t0 = time.time()
     
@@ -408,11 +444,17 @@ def _solve_schedule_impl(request: ScheduleRequest) -> ScheduleResponse:
                     model.add(max_load >= task_ends[(job.job_id, last_task.task_id)])
             model.minimize(max_load)
         
+        if hint is not None and hint.schedule:
+            _add_solution_hints(model, hint, horizon, task_starts, task_ends, all_task_vars, presence_literals)
+
         # ── Solve ──
         solver = cp_model.CpSolver()
         solver.parameters.max_time_in_seconds = request.max_solve_time_seconds
-        solver.parameters.num_workers = 4  # parallel search
+        solver.parameters.num_workers = parallel.CPSAT_WORKERS  # parallel search
         solver.parameters.log_search_progress = False
+        if light_presolve:
+            solver.parameters.cp_model_probing_level = 0
+            solver.parameters.max_presolve_iterations = 1
         
         status = solver.solve(model)
         solve_time = time.time() - t0
@@ -583,8 +625,13 @@ def _compute_metrics(
     )
 
 
-def solve_schedule(request: ScheduleRequest) -> ScheduleResponse:
-    """Traced wrapper around _solve_schedule_impl. Adds OTel span with FJSP attributes."""
+def solve_schedule(request: ScheduleRequest, hint: Optional[ScheduleResponse] = None,
+                   light_presolve: bool = False) -> ScheduleResponse:
+    """
+    Traced wrapper around _solve_schedule_impl. Adds OTel span with FJSP attributes.
+    hint: optional previous solution (same jobs/machines) used as a CP-SAT warm start.
+    light_presolve: cheap presolve for re-solves of a model that was just solved in full.
+    """
     with tracer.start_as_current_span("solve_schedule") as span:
         n_jobs = len(request.jobs)
         n_machines = len(request.machines)
@@ -595,7 +642,7 @@ def solve_schedule(request: ScheduleRequest) -> ScheduleResponse:
 
         t0 = time.perf_counter()
         try:
-            response = _solve_schedule_impl(request)
+            response = _solve_schedule_impl(request, hint, light_presolve)
         except Exception as e:
             span.set_status(Status(StatusCode.ERROR, str(e)))
             span.record_exception(e)
@@ -0,0 +1,26 @@
+"""
+OptimEngine — Lazy engine exports
+Package-level solver entrypoints that are imported on first access.
+
+Design:
+- Engines pull in OR-Tools (and numpy), so importing a package for its models
+  (`routing.models`, the API's request schemas) must not import its engine.
+- Each package keeps exporting its entrypoints (`from routing import solve_routing`)
+  through a module __getattr__ (PEP 562) built here.
+"""
+
+from importlib import import_module
+from typing import Callable
+
+
+def lazy_engine(package: str, names: dict[str, str]) -> Callable[[str], object]:
+    """
+    Module __getattr__ for `package` that resolves each exported name from its
+    submodule on first access. names: exported name -> submodule (e.g. "engine").
+    """
+    def __getattr__(name: str):
+        if name in names:
+            return getattr(import_module(f".{names[name]}", package), name)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
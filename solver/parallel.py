@@ -0,0 +1,124 @@
+"""
+OptimEngine — Parallel sub-solves
+Process pool for the independent re-solves that L2/L3 engines fan out
+(sensitivity perturbations, robust/stochastic scenarios, Pareto weights).
+
+Design:
+- OR-Tools solves are CPU-bound; separate processes give real N-way parallelism.
+- The pool is created on first use and shared by every engine in the process.
+- A pool that breaks (a worker killed) is replaced by the next call; a batch that finds it
+  already broken at submit time is sent to the fresh pool instead of failing.
+- SUBSOLVE_WORKERS (default: CPU count) sizes it; with 1 worker, or a single task,
+  solves run inline and nothing is pickled.
+- forkserver avoids forking a multithreaded parent (uvicorn, OTel exporters).
+- CP-SAT search threads per solve come from CPSAT_WORKERS (default 4). Pool workers
+  override it to 1: their parallelism comes from solving many models at once, and
+  N processes x M threads would oversubscribe the CPUs.
+- Workers are long-lived and import the L1 engines (and OR-Tools with them) when they
+  start, so no sub-solve pays the import. preload() is the same initializer for the
+  API server's own solver pool.
+"""
+
+import importlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Callable
+
+SUBSOLVE_WORKERS = int(os.environ.get("SUBSOLVE_WORKERS", os.cpu_count() or 1))
+CPSAT_WORKERS = int(os.environ.get("CPSAT_WORKERS", 4))
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = Lock()
+
+
+# Engines the sub-solve workers run (L2/L3 re-solves are always L1 problems).
+L1_ENGINES = ("solver.engine", "routing.engine", "packing.engine")
+
+
+def preload(modules: tuple[str, ...]) -> None:
+    """Pool initializer: import solver modules up front instead of on the first task."""
+    for name in modules:
+        importlib.import_module(name)
+
+
+def _init_subsolve_worker() -> None:
+    global CPSAT_WORKERS
+    CPSAT_WORKERS = 1
+    preload(L1_ENGINES)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=SUBSOLVE_WORKERS,
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=_init_subsolve_worker,
+            )
+        return _pool
+
+
+def _reset_pool(failed: ProcessPoolExecutor | None = None) -> None:
+    """
+    Drop the pool so the next call starts a fresh one. With `failed`, only if that pool
+    is still the current one: concurrent callers that saw the same breakage must not
+    shut down the replacement the first of them already started.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or (failed is not None and _pool is not failed):
+            return
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _submit_all(fn: Callable, tasks: list[tuple]) -> tuple[ProcessPoolExecutor, list]:
+    pool = _get_pool()
+    try:
+        return pool, [pool.submit(fn, *args) for args in tasks]
+    except BrokenProcessPool:
+        _reset_pool(pool)
+        raise
+
+
+def map_solves(fn: Callable, tasks: list[tuple]) -> list:
+    """
+    Return [fn(*args) for args in tasks], in order, solving in parallel.
+    A task that raises yields its exception in place of a result
+    (like asyncio.gather(return_exceptions=True)); fn must be picklable.
+    """
+    if SUBSOLVE_WORKERS <= 1 or len(tasks) <= 1:
+        results = []
+        for args in tasks:
+            try:
+                results.append(fn(*args))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    try:
+        pool, futures = _submit_all(fn, tasks)
+    except BrokenProcessPool:
+        # The pool died while idle (e.g. a worker was OOM-killed between requests):
+        # solves are pure, so submit the batch again to a fresh pool.
+        pool, futures = _submit_all(fn, tasks)
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except BrokenProcessPool:
+            # A worker crashed mid-batch; drop the pool so the next call starts a fresh one.
+            _reset_pool(pool)
+            raise
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def shutdown() -> None:
+    """Stop the pool (if started). Called on server shutdown."""
+    _reset_pool()
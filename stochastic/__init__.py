@@ -1,3 +1,5 @@
 """OptimEngine Stochastic — Probabilistic Optimization with Monte Carlo + CVaR."""
 from .models import *  # noqa: F401,F403
-from .engine import optimize_stochastic  # noqa: F401
+from solver.lazy import lazy_engine
+
+__getattr__ = lazy_engine(__name__, {"optimize_stochastic": "engine"})
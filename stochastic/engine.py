@@ -32,6 +32,7 @@ from routing.models import RoutingRequest
 from routing.engine import solve_routing
 from packing.models import PackingRequest
 from packing.engine import solve_packing
+from solver.parallel import map_solves
 
 
 # ─── Path resolution ───
@@ -231,13 +232,9 @@ def _optimize_stochastic_impl(request: StochasticRequest) -> StochasticResponse:
             request.seed,
         )
 
-        # 3. Solve each scenario
-        outcomes = []
-        feasible_objectives = []
-
-        obj_name = "objective"
-
-        for i, scenario in enumerate(scenarios):
+        # 3. Solve each scenario (independent solves, run as one parallel batch)
+        scenario_tasks = []
+        for scenario in scenarios:
             scenario_data = copy.deepcopy(data)
             scenario_data["max_solve_time_seconds"] = request.max_solve_time_seconds
             for path, val in scenario.items():
@@ -248,11 +245,15 @@ def _optimize_stochastic_impl(request: StochasticRequest) -> StochasticResponse:
                     _set_path(scenario_data, path, val)
                 except Exception:
                     continue
+            scenario_tasks.append((request.solver_type, scenario_data))
 
-            try:
-                status, obj, obj_name = _solve(request.solver_type, scenario_data)
-                total_solves += 1
-            except Exception:
+        outcomes = []
+        feasible_objectives = []
+
+        obj_name = "objective"
+
+        for i, (scenario, solved) in enumerate(zip(scenarios, map_solves(_solve, scenario_tasks))):
+            if isinstance(solved, Exception):
                 outcomes.append(ScenarioOutcome(
                     scenario_id=i,
                     parameter_values=scenario,
@@ -261,6 +262,8 @@ def _optimize_stochastic_impl(request: StochasticRequest) -> StochasticResponse:
                     status="error",
                 ))
                 continue
+            status, obj, obj_name = solved
+            total_solves += 1
 
             feasible = status in ("optimal", "feasible")
             if feasible:
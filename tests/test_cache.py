@@ -0,0 +1,121 @@
+"""Tests for the OptimEngine L1 solve cache."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api import cache
+from api.metrics import REGISTRY
+from packing.models import PackingRequest, Item, Bin, PackingStatus
+from packing.engine import solve_packing
+from routing.models import RoutingRequest, Location, Vehicle, DistanceEntry
+from routing.engine import solve_routing
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(scope="module")
+def client():
+    from api.server import app
+    with TestClient(app) as c:
+        yield c
+
+
+def make_request(**kwargs) -> PackingRequest:
+    return PackingRequest(
+        items=[Item(item_id=f"i{i}", weight=10) for i in range(3)],
+        bins=[Bin(bin_id="b1", weight_capacity=50)],
+        max_solve_time_seconds=5,
+        **kwargs,
+    )
+
+
+def make_routing_request(vehicle_ids: list[str]) -> RoutingRequest:
+    ids = ["depot", "c1", "c2", "c3"]
+    return RoutingRequest(
+        depot_id="depot",
+        locations=[Location(location_id=lid, demand=0 if lid == "depot" else 10) for lid in ids],
+        vehicles=[Vehicle(vehicle_id=vid, capacity=20) for vid in vehicle_ids],
+        distance_matrix=[
+            DistanceEntry(from_id=a, to_id=b, distance=abs(i - j) * 100)
+            for i, a in enumerate(ids) for j, b in enumerate(ids) if i != j
+        ],
+        max_solve_time_seconds=5,
+    )
+
+
+def solve_and_store(fn, request):
+    key, _ = cache.lookup(fn, request)
+    response = fn(request)
+    cache.store(key, response)
+    return response
+
+
+class TestSolveCache:
+    def test_identical_request_is_served_from_cache(self):
+        first = solve_and_store(solve_packing, make_request())
+        _, hit = cache.lookup(solve_packing, make_request())
+        assert first.status in (PackingStatus.OPTIMAL, PackingStatus.FEASIBLE)
+        assert hit is first
+
+    def test_different_request_misses(self):
+        solve_and_store(solve_packing, make_request())
+        _, hit = cache.lookup(solve_packing, make_request(allow_partial=True))
+        assert hit is None
+
+    def test_key_ignores_dict_ordering(self):
+        a = make_request()
+        b = PackingRequest(**{k: v for k, v in reversed(list(a.model_dump().items()))})
+        assert cache.request_key(solve_packing, a) == cache.request_key(solve_packing, b)
+
+    def test_errors_are_not_cached(self):
+        key, _ = cache.lookup(solve_packing, make_request())
+        cache.store(key, solve_packing(make_request()).model_copy(update={"status": PackingStatus.ERROR}))
+        _, hit = cache.lookup(solve_packing, make_request())
+        assert hit is None
+
+    def test_key_keeps_entity_list_order(self):
+        a = make_request()
+        b = make_request()
+        b.items.reverse()
+        assert cache.request_key(solve_packing, a) != cache.request_key(solve_packing, b)
+
+    def test_key_ignores_lookup_table_order(self):
+        a = make_routing_request(["v1", "v2"])
+        b = make_routing_request(["v1", "v2"])
+        b.distance_matrix.reverse()
+        assert cache.request_key(solve_routing, a) == cache.request_key(solve_routing, b)
+
+    def test_key_ignores_explicit_defaults(self):
+        a = make_request()
+        b = make_request(allow_partial=False)
+        assert cache.request_key(solve_packing, a) == cache.request_key(solve_packing, b)
+
+
+class TestEndpointCache:
+    def test_repeated_request_is_a_cache_hit(self, client):
+        labels = {"solver": "solve_packing"}
+        body = make_request().model_dump(mode="json")
+        before = REGISTRY.get_sample_value("optimengine_solve_cache_hits_total", labels) or 0
+        first = client.post("/optimize_packing", json=body)
+        second = client.post("/optimize_packing", json=body)
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json()
+        assert REGISTRY.get_sample_value("optimengine_solve_cache_hits_total", labels) == before + 1
+
+    def test_reordered_routing_request_keeps_its_vehicle_order(self, client):
+        client.post("/optimize_routing", json=make_routing_request(["v1", "v2"]).model_dump(mode="json"))
+        resp = client.post("/optimize_routing", json=make_routing_request(["v2", "v1"]).model_dump(mode="json"))
+        assert [r["vehicle_id"] for r in resp.json()["routes"]] == ["v2", "v1"]
+
+    def test_reordered_packing_request_keeps_its_bin_order(self, client):
+        bins = [Bin(bin_id="b1", weight_capacity=50), Bin(bin_id="b2", weight_capacity=50)]
+        client.post("/optimize_packing", json=make_request().model_copy(update={"bins": bins}).model_dump(mode="json"))
+        resp = client.post(
+            "/optimize_packing", json=make_request().model_copy(update={"bins": bins[::-1]}).model_dump(mode="json")
+        )
+        assert [s["bin_id"] for s in resp.json()["bin_summaries"]] == ["b2", "b1"]
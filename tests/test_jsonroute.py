@@ -0,0 +1,34 @@
+"""Tests for orjson request parsing."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.jsonroute import OrjsonRoute
+from packing.models import PackingRequest
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.router.route_class = OrjsonRoute
+
+    @app.post("/echo")
+    async def echo(request: PackingRequest) -> dict:
+        return {"items": len(request.items), "objective": request.objective.value}
+
+    return TestClient(app)
+
+
+class TestOrjsonRoute:
+    def test_body_is_validated_into_model(self):
+        body = {"items": [{"item_id": "a", "weight": 3}], "bins": [{"bin_id": "b", "weight_capacity": 5}]}
+        r = make_client().post("/echo", json=body)
+        assert r.status_code == 200
+        assert r.json() == {"items": 1, "objective": "minimize_bins"}
+
+    def test_malformed_json_is_422(self):
+        r = make_client().post("/echo", content=b"{bad", headers={"content-type": "application/json"})
+        assert r.status_code == 422
+
+    def test_model_validation_errors_are_422(self):
+        r = make_client().post("/echo", json={"items": []})
+        assert r.status_code == 422
@@ -4,7 +4,7 @@ import pytest
 from packing.models import (
     PackingRequest, Item, Bin, PackingObjective, PackingStatus,
 )
-from packing.engine import solve_packing
+from packing.engine import solve_packing, _first_fit_decreasing
 
 
 def make_simple_request(
@@ -68,6 +68,14 @@ class TestCapacity:
         resp = solve_packing(req)
         assert resp.status == PackingStatus.NO_SOLUTION
 
+    def test_precheck_rejects_oversized_group(self):
+        items = [Item(item_id=f"g{i}", weight=6, group="G") for i in range(2)]
+        bins = [Bin(bin_id="b1", weight_capacity=10), Bin(bin_id="b2", weight_capacity=10)]
+        req = PackingRequest(items=items, bins=bins, keep_groups_together=True, max_solve_time_seconds=10)
+        resp = solve_packing(req)
+        assert resp.status == PackingStatus.NO_SOLUTION
+        assert "Group 'G'" in resp.message
+
     def test_volume_constraint(self):
         items = [
             Item(item_id=f"i{i}", weight=5, volume=15) for i in range(4)
@@ -132,6 +140,13 @@ class TestObjectives:
         ))
         assert resp.status in (PackingStatus.OPTIMAL, PackingStatus.FEASIBLE)
 
+    def test_balance_load_spreads_evenly(self):
+        resp = solve_packing(make_simple_request(
+            6, 10, 3, 30, objective=PackingObjective.BALANCE_LOAD
+        ))
+        assert resp.status == PackingStatus.OPTIMAL
+        assert [bs.weight_used for bs in resp.bin_summaries] == [20, 20, 20]
+
 
 class TestPartialPacking:
     def test_partial_allowed(self):
@@ -168,6 +183,14 @@ class TestQuantities:
         resp = solve_packing(req)
         assert resp.metrics.bins_used == 3
 
+    def test_bin_copies_used_in_order(self):
+        items = [Item(item_id=f"i{i}", weight=10) for i in range(6)]
+        bins = [Bin(bin_id="box", weight_capacity=25, quantity=8)]
+        req = PackingRequest(items=items, bins=bins, max_solve_time_seconds=10)
+        resp = solve_packing(req)
+        assert resp.status == PackingStatus.OPTIMAL
+        assert [s.is_used for s in resp.bin_summaries] == [True] * 3 + [False] * 5
+
 
 class TestGroups:
     def test_groups_together(self):
@@ -191,6 +214,20 @@ class TestGroups:
                 a_bins.add(a.bin_id)
         assert len(a_bins) == 1
 
+    def test_group_counts_every_member(self):
+        # The 3-item group exceeds max_items as a whole, so only the loose items fit.
+        items = [Item(item_id=f"g{i}", weight=1, group="G") for i in range(3)]
+        items += [Item(item_id="x1", weight=1), Item(item_id="x2", weight=1)]
+        bins = [Bin(bin_id="b1", weight_capacity=100, max_items=2)]
+        req = PackingRequest(
+            items=items, bins=bins, keep_groups_together=True, allow_partial=True,
+            objective=PackingObjective.MAXIMIZE_ITEMS, max_solve_time_seconds=10,
+        )
+        resp = solve_packing(req)
+        assert resp.status == PackingStatus.OPTIMAL
+        assert sorted(a.item_id for a in resp.assignments) == ["x1", "x2"]
+        assert sorted(resp.unpacked_items) == ["g0", "g1", "g2"]
+
 
 class TestMaxItems:
     def test_max_items_per_bin(self):
@@ -282,3 +319,46 @@ class TestRealisticScenario:
                 assert bs.weight_used <= bs.weight_capacity
                 if bs.volume_capacity > 0:
                     assert bs.volume_used <= bs.volume_capacity
+        assert resp.metrics.total_weight_packed == 3 * 10 + 8 * 5 + 1 * 20 + 30 * 2
+        assert resp.metrics.total_volume_packed == sum(bs.volume_used for bs in resp.bin_summaries)
+        assert resp.metrics.total_value_packed == sum(a.value for a in resp.assignments)
+
+
+class TestWarmStart:
+    def test_hint_from_same_request(self):
+        req = make_simple_request(6, 10, 3, 30)
+        base = solve_packing(req)
+        resp = solve_packing(req, hint=base)
+        assert resp.status == base.status
+        assert resp.metrics.bins_used == base.metrics.bins_used
+
+    def test_hint_from_perturbed_request(self):
+        base = solve_packing(make_simple_request(6, 10, 3, 30))
+        resp = solve_packing(make_simple_request(6, 10, 3, 20), hint=base)
+        assert resp.status in (PackingStatus.OPTIMAL, PackingStatus.FEASIBLE)
+        assert resp.metrics.bins_used == 3
+        for bs in resp.bin_summaries:
+            assert bs.weight_used <= bs.weight_capacity
+
+    def test_hint_with_quantities(self):
+        items = [Item(item_id="widget", weight=10, quantity=4)]
+        bins = [Bin(bin_id="box", weight_capacity=25, quantity=2)]
+        req = PackingRequest(items=items, bins=bins, max_solve_time_seconds=10)
+        base = solve_packing(req)
+        resp = solve_packing(req, hint=base)
+        assert resp.metrics.items_packed == 4
+        assert resp.metrics.bins_used == 2
+
+    def test_mismatched_bins_hint_ignored(self):
+        base = solve_packing(make_simple_request(4, 10, 2, 30))
+        resp = solve_packing(make_simple_request(4, 10, 3, 30), hint=base)
+        assert resp.status in (PackingStatus.OPTIMAL, PackingStatus.FEASIBLE)
+        assert resp.metrics.items_packed == 4
+
+    def test_first_fit_decreasing(self):
+        bins = [
+            {"weight_capacity": 10, "volume_capacity": 0, "max_items": None},
+            {"weight_capacity": 10, "volume_capacity": 5, "max_items": 1},
+        ]
+        # Heaviest first: 7 -> bin 0, 6 -> bin 1, 4 -> nowhere left, 3 -> bin 0.
+        assert _first_fit_decreasing(bins, [3, 7, 4, 6], [0, 0, 0, 5], [1, 1, 1, 1]) == [0, 0, None, 1]
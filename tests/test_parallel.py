@@ -0,0 +1,77 @@
+"""Tests for the OptimEngine parallel sub-solve pool."""
+
+import os
+import signal
+import time
+
+import pytest
+from solver import parallel
+
+
+@pytest.fixture(params=[1, 2], ids=["inline", "pool"])
+def workers(request, monkeypatch):
+    monkeypatch.setattr(parallel, "SUBSOLVE_WORKERS", request.param)
+    yield request.param
+    parallel.shutdown()
+
+
+class TestMapSolves:
+    def test_results_keep_task_order(self, workers):
+        assert parallel.map_solves(pow, [(2, 3), (3, 2), (5, 0)]) == [8, 9, 1]
+
+    def test_exceptions_are_returned_in_place(self, workers):
+        results = parallel.map_solves(pow, [(2, 2), ("a", 2), (2, 1)])
+        assert results[0] == 4 and results[2] == 2
+        assert isinstance(results[1], TypeError)
+
+    def test_empty_task_list(self, workers):
+        assert parallel.map_solves(pow, []) == []
+
+
+class TestBrokenPool:
+    def test_pool_broken_while_idle_is_replaced(self, monkeypatch):
+        monkeypatch.setattr(parallel, "SUBSOLVE_WORKERS", 2)
+        try:
+            assert parallel.map_solves(pow, [(2, 1), (2, 2)]) == [2, 4]
+            dead = parallel._pool
+            for pid in list(dead._processes):
+                os.kill(pid, signal.SIGKILL)
+            deadline = time.monotonic() + 10
+            while not dead._broken and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert dead._broken
+            assert parallel.map_solves(pow, [(3, 1), (3, 2)]) == [3, 9]
+            assert parallel._pool is not dead
+        finally:
+            parallel.shutdown()
+
+    def test_stale_reset_keeps_replacement_pool(self, monkeypatch):
+        monkeypatch.setattr(parallel, "SUBSOLVE_WORKERS", 2)
+        try:
+            parallel.map_solves(pow, [(2, 1), (2, 2)])
+            failed = parallel._pool
+            parallel._reset_pool(failed)
+            parallel.map_solves(pow, [(2, 1), (2, 2)])
+            replacement = parallel._pool
+            parallel._reset_pool(failed)
+            assert parallel._pool is replacement
+        finally:
+            parallel.shutdown()
+
+
+def _cpsat_workers() -> int:
+    return parallel.CPSAT_WORKERS
+
+
+class TestCpsatWorkers:
+    def test_pool_workers_solve_single_threaded(self, monkeypatch):
+        monkeypatch.setattr(parallel, "SUBSOLVE_WORKERS", 2)
+        try:
+            assert parallel.map_solves(_cpsat_workers, [(), ()]) == [1, 1]
+        finally:
+            parallel.shutdown()
+
+    def test_inline_solves_keep_configured_threads(self, monkeypatch):
+        monkeypatch.setattr(parallel, "SUBSOLVE_WORKERS", 1)
+        monkeypatch.setattr(parallel, "CPSAT_WORKERS", 8)
+        assert parallel.map_solves(_cpsat_workers, [(), ()]) == [8, 8]
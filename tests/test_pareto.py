@@ -1,10 +1,13 @@
 """Tests for OptimEngine Multi-objective Pareto Optimization."""
 
+import numpy as np
 import pytest
 from pareto.models import (
-    ParetoRequest, ParetoSolverType, ObjectiveSpec,
+    ParetoRequest, ParetoSolverType, ObjectiveSpec, ParetoPoint,
+)
+from pareto.engine import (
+    optimize_pareto, _frontier_mask, _objective_matrix, _objective_signs, _pareto_front_mask, _pareto_front_mask_2d,
 )
-from pareto.engine import optimize_pareto
 
 
 SCHEDULING_REQUEST = {
@@ -187,7 +190,9 @@ class TestRoutingPareto:
         )
         resp = optimize_pareto(req)
         assert resp.status == "completed"
-        assert resp.metrics.total_solves >= 3
+        # One solve per distinct primary objective, shared by the 5 weight vectors.
+        assert resp.metrics.points_generated == 5
+        assert 1 <= resp.metrics.total_solves <= 2
 
 
 class TestPackingPareto:
@@ -204,6 +209,8 @@ class TestPackingPareto:
         )
         resp = optimize_pareto(req)
         assert resp.status == "completed"
+        # Read from PackingMetrics.total_value_packed, not a silent 0
+        assert all(p.objectives["maximize_value"] > 0 for p in resp.frontier)
 
 
 class TestMetrics:
@@ -293,4 +300,62 @@ class TestEdgeCases:
             max_solve_time_seconds=5,
         )
         resp = optimize_pareto(req)
-        assert resp.metrics.total_solves == 5
+        # 5 weight vectors but only 2 distinct primary objectives: one solve each.
+        assert resp.metrics.points_generated == 5
+        assert resp.metrics.total_solves == 2
+
+
+def make_point(point_id: int, **objectives) -> ParetoPoint:
+    return ParetoPoint(point_id=point_id, objectives=objectives, weights_used={}, feasible=True, status="optimal")
+
+
+class TestDominance:
+    OBJECTIVES = [ObjectiveSpec(name="minimize_makespan"), ObjectiveSpec(name="maximize_machine_utilization")]
+
+    def front_ids(self, points, objectives=None):
+        objectives = objectives or self.OBJECTIVES
+        values = _objective_matrix(points, [o.name for o in objectives])
+        mask = _frontier_mask(values * _objective_signs(objectives))
+        return [p.point_id for p, keep in zip(points, mask) if keep]
+
+    def test_dominated_point_removed(self):
+        points = [
+            make_point(0, minimize_makespan=10, maximize_machine_utilization=80),
+            make_point(1, minimize_makespan=12, maximize_machine_utilization=70),
+            make_point(2, minimize_makespan=8, maximize_machine_utilization=60),
+        ]
+        assert self.front_ids(points) == [0, 2]
+
+    def test_ties_are_kept(self):
+        points = [
+            make_point(0, minimize_makespan=10, maximize_machine_utilization=80),
+            make_point(1, minimize_makespan=10, maximize_machine_utilization=80),
+        ]
+        assert self.front_ids(points) == [0, 1]
+
+    def test_scalar_path_matches_sweep(self):
+        rng = np.random.default_rng(1)
+        for _ in range(200):
+            loss = rng.integers(0, 4, size=(rng.integers(1, 8), 3)).astype(float)
+            assert (_frontier_mask(loss) == _pareto_front_mask(loss)).all()
+
+    def test_repeated_rows_share_verdict(self):
+        # Points that share a primary objective repeat the same objective values
+        points = [make_point(i, minimize_makespan=10, maximize_machine_utilization=80) for i in range(6)]
+        points += [make_point(i, minimize_makespan=12, maximize_machine_utilization=70) for i in range(6, 12)]
+        assert self.front_ids(points) == list(range(6))
+
+    def test_three_objectives(self):
+        objectives = self.OBJECTIVES + [ObjectiveSpec(name="minimize_total_tardiness")]
+        points = [
+            make_point(0, minimize_makespan=10, maximize_machine_utilization=80, minimize_total_tardiness=5),
+            make_point(1, minimize_makespan=10, maximize_machine_utilization=80, minimize_total_tardiness=6),
+            make_point(2, minimize_makespan=9, maximize_machine_utilization=70, minimize_total_tardiness=7),
+        ]
+        assert self.front_ids(points, objectives) == [0, 2]
+
+    def test_2d_fast_path_matches_general_sweep(self):
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            loss = rng.integers(0, 6, size=(rng.integers(1, 30), 2)).astype(float)
+            assert (_pareto_front_mask_2d(loss) == _pareto_front_mask(loss)).all()
@@ -1,11 +1,17 @@
 """Tests for OptimEngine Prescriptive Intelligence."""
 
+import numpy as np
 import pytest
+
+import prescriptive.engine as prescriptive_engine
 from prescriptive.models import (
     PrescriptiveRequest, PrescriptiveSolverType, ForecastMethod,
     ForecastParameter, TimeSeriesPoint, RiskAppetite,
 )
-from prescriptive.engine import prescriptive_advise
+from prescriptive.engine import (
+    prescriptive_advise, _ses_fit, SES_ALPHAS, _compile_path, _cow_set, _forecast_core, _forecast_parameter,
+    _z_score,
+)
 
 
 # Increasing demand pattern
@@ -116,6 +122,30 @@ class TestForecastMethods:
         assert len(resp.forecasts) == 1
         assert resp.forecasts[0].forecast_value > 0
 
+    def test_ses_fit_picks_least_residual_alpha(self):
+        values = np.array([p.value for p in DEMAND_HISTORY], dtype=float)
+        alpha, level, rms = _ses_fit(values)
+        assert alpha in SES_ALPHAS
+        assert all(rms <= _ses_fit(values, a)[2] for a in SES_ALPHAS)
+        assert (level, rms) == _ses_fit(values, alpha)[1:]
+
+    def test_forecast_is_cached_per_history(self):
+        params = [
+            ForecastParameter(parameter_path=path, historical_data=list(reversed(DEMAND_HISTORY)))
+            for path in ("jobs[J1].tasks[cut].duration", "jobs[J2].tasks[cut].duration")
+        ]
+        _forecast_core.cache_clear()
+        first, second = (_forecast_parameter(p) for p in params)
+        assert _forecast_core.cache_info().hits == 1
+        assert second.parameter_path == params[1].parameter_path
+        assert second.model_dump(exclude={"parameter_path"}) == first.model_dump(exclude={"parameter_path"})
+
+    def test_z_score_for_any_confidence_level(self):
+        assert _z_score(0.95) == 1.96
+        assert _z_score(0.975) == pytest.approx(2.2414, abs=1e-4)
+        assert _z_score(0.85) == pytest.approx(1.4395, abs=1e-4)
+        assert _z_score(0.9) < _z_score(0.925) < _z_score(0.95)
+
     def test_moving_average(self):
         req = PrescriptiveRequest(
             solver_type=PrescriptiveSolverType.SCHEDULING,
@@ -389,3 +419,40 @@ class TestEdgeCases:
         fc = resp.forecasts[0]
         assert fc.lower_bound <= fc.forecast_value
         assert fc.forecast_value <= fc.upper_bound
+
+    def test_identical_scenarios_solved_once(self, monkeypatch):
+        batches = []
+        real_map_solves = prescriptive_engine.map_solves
+
+        def counting_map_solves(fn, tasks):
+            batches.append(len(tasks))
+            return real_map_solves(fn, tasks)
+
+        monkeypatch.setattr(prescriptive_engine, "map_solves", counting_map_solves)
+        req = PrescriptiveRequest(
+            solver_type=PrescriptiveSolverType.SCHEDULING,
+            solver_request=SCHEDULING_REQUEST,
+            forecast_parameters=[
+                ForecastParameter(
+                    parameter_path="jobs[J1].tasks[cut].duration",
+                    historical_data=[TimeSeriesPoint(period=i, value=30) for i in range(5)],
+                ),
+            ],
+            max_solve_time_seconds=5,
+        )
+        resp = prescriptive_advise(req)
+        assert resp.status == "completed"
+        assert batches == [1]
+        assert resp.risk.conservative_objective == resp.risk.moderate_objective == resp.risk.aggressive_objective
+
+    def test_scenario_copy_on_write(self):
+        indexes = {}
+        scenario = _cow_set(SCHEDULING_REQUEST, _compile_path("jobs[J1].tasks[weld].duration"), 99, indexes)
+        scenario = _cow_set(scenario, _compile_path("jobs[J1].due_date"), 150, indexes)
+        assert scenario["jobs"][0]["tasks"][1]["duration"] == 99
+        assert scenario["jobs"][0]["due_date"] == 150
+        # The base request is untouched and unchanged subtrees are shared, not copied
+        assert SCHEDULING_REQUEST["jobs"][0]["tasks"][1]["duration"] == 20
+        assert SCHEDULING_REQUEST["jobs"][0]["due_date"] == 100
+        assert scenario["jobs"][1] is SCHEDULING_REQUEST["jobs"][1]
+        assert scenario["jobs"][0]["tasks"][0] is SCHEDULING_REQUEST["jobs"][0]["tasks"][0]
@@ -0,0 +1,33 @@
+"""Tests for the OptimEngine JSON response classes."""
+
+import json
+
+from api import responses
+from api.responses import ModelStreamingResponse, _iter_model_json
+from packing.models import PackingResponse, PackingStatus, PackedItem
+
+
+def make_response(n: int) -> PackingResponse:
+    return PackingResponse(
+        status=PackingStatus.OPTIMAL,
+        message="ok",
+        assignments=[PackedItem(item_id=f"i{i}", bin_id="b1", weight=1, volume=0, value=1) for i in range(n)],
+    )
+
+
+class TestModelStreaming:
+    def test_stream_matches_model_dump_json(self):
+        model = make_response(50)
+        body = b"".join(_iter_model_json(model))
+        assert json.loads(body) == json.loads(model.model_dump_json())
+
+    def test_large_lists_are_chunked(self, monkeypatch):
+        monkeypatch.setattr(responses, "STREAM_CHUNK_BYTES", 256)
+        model = make_response(200)
+        chunks = list(_iter_model_json(model))
+        assert len(chunks) > 1
+        assert json.loads(b"".join(chunks)) == json.loads(model.model_dump_json())
+
+    def test_solver_result_is_kept(self):
+        model = make_response(1)
+        assert ModelStreamingResponse(model).solver_result is model
@@ -215,3 +215,22 @@ class TestRealisticScenario:
         for i, route in enumerate(resp.routes):
             if route.is_used:
                 assert route.total_load <= req.vehicles[i].capacity
+
+
+class TestWarmStart:
+    def test_hint_from_same_request(self):
+        req = make_simple_request(5, 2, 30).model_copy(update={"max_solve_time_seconds": 2})
+        base = solve_routing(req)
+        resp = solve_routing(req, hint=base)
+        assert resp.status in (RoutingStatus.OPTIMAL, RoutingStatus.FEASIBLE)
+        assert resp.metrics.total_distance <= base.metrics.total_distance
+
+    def test_infeasible_hint_falls_back(self):
+        base = solve_routing(make_simple_request(4, 2, 40).model_copy(update={"max_solve_time_seconds": 2}))
+        # Base routes carry more load than the new capacity allows
+        req = make_simple_request(4, 2, 20).model_copy(update={"max_solve_time_seconds": 2})
+        resp = solve_routing(req, hint=base)
+        assert resp.status in (RoutingStatus.OPTIMAL, RoutingStatus.FEASIBLE)
+        assert resp.metrics.locations_served == 4
+        for route in resp.routes:
+            assert route.total_load <= 20
@@ -0,0 +1,237 @@
+"""Tests for the OptimEngine API server: solver pool scheduling and request coalescing."""
+
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from fastapi import HTTPException
+
+from api import cache, server
+from api.metrics import REGISTRY, instrument_solver
+from packing.engine import solve_packing
+from packing.models import PackingRequest, Item, Bin
+
+
+class BrokenPool:
+    """Executor whose every solve fails the way a crashed worker does."""
+
+    def __init__(self):
+        self.is_shut_down = False
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.is_shut_down = True
+
+
+@pytest.fixture
+def slots(monkeypatch):
+    """Fresh concurrency slots per test (each test runs its own event loop)."""
+    def set_slots(n: int):
+        monkeypatch.setattr(server, "_solve_slots", asyncio.Semaphore(n))
+    set_slots(server.SOLVE_CONCURRENCY)
+    return set_slots
+
+
+@pytest.fixture
+def thread_pool(monkeypatch):
+    """Stand-in solver pool: threads, so a test can hold a solve open with an Event."""
+    pool = ThreadPoolExecutor(max_workers=4)
+    monkeypatch.setattr(server.app.state, "solver_pool", pool, raising=False)
+    yield pool
+    pool.shutdown(wait=False)
+
+
+def slot_counts() -> dict:
+    body = json.loads(asyncio.run(server.health()).body)
+    return body["solver_slots"]
+
+
+class TestLoadShedding:
+    def test_full_queue_is_rejected_with_retry_after(self, monkeypatch, slots, thread_pool):
+        slots(1)
+        monkeypatch.setattr(server, "SOLVE_QUEUE_LIMIT", 1)
+        release = threading.Event()
+
+        async def overload():
+            running = asyncio.ensure_future(server._solve_in_pool(release.wait, 5))
+            queued = asyncio.ensure_future(server._solve_in_pool(release.wait, 5))
+            while server._solves_waiting < 1 or server._solves_in_flight < 1:
+                await asyncio.sleep(0.01)
+            counts = {"in_flight": server._solves_in_flight, "waiting": server._solves_waiting}
+            try:
+                with pytest.raises(HTTPException) as rejected:
+                    await server._solve_in_pool(release.wait, 5)
+            finally:
+                release.set()
+            assert await running and await queued
+            return counts, rejected.value
+
+        counts, exc = asyncio.run(overload())
+        assert counts == {"in_flight": 1, "waiting": 1}
+        assert exc.status_code == 429
+        assert exc.headers == {"Retry-After": "5"}
+        counts = slot_counts()
+        assert (counts["in_flight"], counts["waiting"]) == (0, 0)
+
+    def test_rejection_is_counted_as_rejected(self, monkeypatch, slots, thread_pool):
+        slots(1)
+        monkeypatch.setattr(server, "SOLVE_QUEUE_LIMIT", 1)
+        release = threading.Event()
+        labels = {"endpoint": "/test_shed", "solver_status": "REJECTED"}
+
+        @instrument_solver("/test_shed")
+        async def endpoint():
+            return await server._solve_in_pool(release.wait, 5)
+
+        async def overload():
+            held = [asyncio.ensure_future(endpoint()) for _ in range(2)]
+            while server._solves_waiting < 1:
+                await asyncio.sleep(0.01)
+            try:
+                with pytest.raises(HTTPException):
+                    await endpoint()
+            finally:
+                release.set()
+            await asyncio.gather(*held)
+
+        asyncio.run(overload())
+        assert REGISTRY.get_sample_value("optimengine_solver_requests_total", labels) == 1
+
+    @pytest.mark.parametrize("endpoint", ["ep_pareto", "ep_prescriptive"])
+    def test_orchestrating_endpoint_holds_a_slot_and_sheds_load(self, monkeypatch, slots, thread_pool, endpoint):
+        slots(1)
+        monkeypatch.setattr(server, "SOLVE_QUEUE_LIMIT", 1)
+        release = threading.Event()
+
+        async def overload():
+            running = asyncio.ensure_future(server._orchestrate_in_slot(release.wait, 5))
+            while server._solves_in_flight < 1:
+                await asyncio.sleep(0.01)
+            queued = asyncio.ensure_future(server._solve_in_pool(release.wait, 5))
+            while server._solves_waiting < 1:
+                await asyncio.sleep(0.01)
+            try:
+                # Rejected before the request reaches the engine
+                with pytest.raises(HTTPException) as rejected:
+                    await getattr(server, endpoint)(None)
+            finally:
+                release.set()
+            assert await running and await queued
+            return rejected.value
+
+        assert asyncio.run(overload()).status_code == 429
+        counts = slot_counts()
+        assert (counts["in_flight"], counts["waiting"]) == (0, 0)
+
+
+class TestBrokenPool:
+    def test_concurrent_failures_replace_the_pool_once(self, monkeypatch, slots):
+        slots(2)
+        broken = BrokenPool()
+        created = []
+        monkeypatch.setattr(server.app.state, "solver_pool", broken, raising=False)
+        monkeypatch.setattr(server, "_new_solver_pool", lambda: created.append(BrokenPool()) or created[-1])
+
+        async def two_solves():
+            return await asyncio.gather(
+                server._solve_in_pool(int, "1"), server._solve_in_pool(int, "2"), return_exceptions=True
+            )
+
+        results = asyncio.run(two_solves())
+        assert all(isinstance(r, BrokenProcessPool) for r in results)
+        assert len(created) == 1
+        assert server.app.state.solver_pool is created[0]
+        assert broken.is_shut_down
+
+
+def make_packing_request(bin_ids=("b1", "b2")) -> PackingRequest:
+    return PackingRequest(
+        items=[Item(item_id=f"i{i}", weight=10) for i in range(3)],
+        bins=[Bin(bin_id=b, weight_capacity=50) for b in bin_ids],
+    )
+
+
+@pytest.fixture
+def gated_solves(monkeypatch):
+    """Replace the pool solve with one that records its request and waits for the test."""
+    cache.clear()
+    calls = []
+    gate = {}
+
+    async def fake_solve_in_pool(fn, request):
+        calls.append(request)
+        await gate["open"].wait()
+        return SimpleNamespace(status="optimal", bins=[b.bin_id for b in request.bins])
+
+    def open_gate():
+        gate["open"] = asyncio.Event()
+        return gate["open"]
+
+    monkeypatch.setattr(server, "_solve_in_pool", fake_solve_in_pool)
+    yield calls, open_gate
+    cache.clear()
+
+
+class TestCoalescing:
+    def test_identical_requests_share_one_solve(self, gated_solves):
+        calls, open_gate = gated_solves
+
+        async def two_clients():
+            gate = open_gate()
+            clients = [
+                asyncio.ensure_future(server._run_solver(solve_packing, make_packing_request()))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0.01)
+            gate.set()
+            return await asyncio.gather(*clients)
+
+        first, second = asyncio.run(two_clients())
+        assert len(calls) == 1
+        assert first is second
+        assert not server._pending_solves
+
+    def test_disconnected_client_does_not_cancel_shared_solve(self, gated_solves):
+        calls, open_gate = gated_solves
+
+        async def one_client_leaves():
+            gate = open_gate()
+            leaving = asyncio.ensure_future(server._run_solver(solve_packing, make_packing_request()))
+            staying = asyncio.ensure_future(server._run_solver(solve_packing, make_packing_request()))
+            await asyncio.sleep(0.01)
+            leaving.cancel()
+            await asyncio.sleep(0.01)
+            gate.set()
+            return leaving, await staying
+
+        leaving, response = asyncio.run(one_client_leaves())
+        assert leaving.cancelled()
+        assert len(calls) == 1
+        assert response.bins == ["b1", "b2"]
+        key, hit = cache.lookup(solve_packing, make_packing_request())
+        assert hit is response
+
+    def test_reordered_request_is_solved_in_its_own_order(self, gated_solves):
+        calls, open_gate = gated_solves
+
+        async def reordered_clients():
+            gate = open_gate()
+            clients = [
+                asyncio.ensure_future(server._run_solver(solve_packing, make_packing_request(bins)))
+                for bins in (("b1", "b2"), ("b2", "b1"))
+            ]
+            await asyncio.sleep(0.01)
+            gate.set()
+            return await asyncio.gather(*clients)
+
+        first, second = asyncio.run(reordered_clients())
+        assert len(calls) == 2
+        assert (first.bins, second.bins) == (["b1", "b2"], ["b2", "b1"])